@@ -0,0 +1,17 @@
+#!/bin/bash
+set -e
+
+# Check if pyinstrument is installed
+if ! command -v pyinstrument &> /dev/null; then
+    echo "pyinstrument is not installed. Install the dev dependencies first:"
+    echo "  pip install -e \".[dev]\""
+    exit 1
+fi
+
+# Profile the unit test suite (or the paths given as arguments) and write an HTML report
+TEST_PATHS=${@:-tests/storage tests/models tests/tools}
+OUTPUT=${PROFILE_OUTPUT:-profile_tests.html}
+
+pyinstrument --show-all -r html -o "$OUTPUT" -m pytest $TEST_PATHS -q -p no:cacheprovider --no-cov
+
+echo "Profile written to $OUTPUT"
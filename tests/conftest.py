@@ -7,6 +7,10 @@ from unittest.mock import patch, MagicMock
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+# Keep agents from warming libmagic in a background thread, where the call
+# would land on tests that patch magic.from_buffer
+os.environ.setdefault('TYLER_NO_WARMUP', '1')
+
 @pytest.fixture(autouse=True)
 def mock_env_vars():
     """Set environment variables for testing"""
@@ -19,15 +23,24 @@ def mock_env_vars():
     }):
         yield
 
-@pytest.fixture(autouse=True)
-def mock_openai():
-    """Mock OpenAI/litellm calls for testing"""
+def _default_completion_response():
+    return MagicMock(
+        choices=[MagicMock(message=MagicMock(content="Test response"))]
+    )
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_openai_session():
+    """Patch litellm.completion once for the whole test session"""
     with patch('litellm.completion') as mock:
-        mock.return_value = MagicMock(
-            choices=[MagicMock(message=MagicMock(content="Test response"))]
-        )
         yield mock
 
+@pytest.fixture(autouse=True)
+def mock_openai(mock_openai_session):
+    """Mock OpenAI/litellm calls for testing, reset before each test"""
+    mock_openai_session.reset_mock(return_value=True, side_effect=True)
+    mock_openai_session.return_value = _default_completion_response()
+    yield mock_openai_session
+
 @pytest.fixture(autouse=True)
 def mock_wandb():
     """Mock wandb calls for testing"""
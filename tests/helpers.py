@@ -0,0 +1,36 @@
+"""Plain helper functions shared by the tests. Fixtures live in conftest.py."""
+from types import SimpleNamespace
+
+def _msg(**kwargs):
+    """Build a Message from trusted literal data without running validation.
+
+    For tests of Thread behaviour only; tests of Message itself should call Message().
+    """
+    from tyler.models.message import Message
+    return Message.model_construct(**kwargs)
+
+def _trusted_rebuild(thread_dict):
+    """Rebuild a Thread from its own model_dump() output without re-validating.
+
+    Only use this on data that was just produced by model_dump(); untrusted
+    input must still go through Thread.model_validate().
+    """
+    from tyler.models.thread import Thread
+    from tyler.models.message import Message
+    from tyler.models.attachment import Attachment
+
+    messages = [
+        Message.model_construct(**{
+            **m,
+            "attachments": [Attachment.model_construct(**a) for a in m.get("attachments", [])]
+        })
+        for m in thread_dict["messages"]
+    ]
+    return Thread.model_construct(**{**thread_dict, "messages": messages})
+
+def _resp(content):
+    """Build a completion response exposing only choices[0].message.content.
+
+    Use this where the code under test reads nothing else from the response.
+    """
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
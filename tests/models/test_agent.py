@@ -20,6 +20,30 @@ import types
 import json
 from types import SimpleNamespace
 
+# Base64 image content returned by the mocked image tools, encoded once for the module
+_TEST_IMAGE_B64 = base64.b64encode(b"test image content").decode('utf-8')
+
+def _mk_completion(content, tool_calls=None, response_id="test-id", completion_tokens=10, prompt_tokens=20):
+    """Build a completion response with a single assistant choice"""
+    return ModelResponse(**{
+        "id": response_id,
+        "choices": [{
+            "finish_reason": "tool_calls" if tool_calls else "stop",
+            "index": 0,
+            "message": {
+                "content": content,
+                "role": "assistant",
+                "tool_calls": tool_calls
+            }
+        }],
+        "model": "gpt-4",
+        "usage": {
+            "completion_tokens": completion_tokens,
+            "prompt_tokens": prompt_tokens,
+            "total_tokens": completion_tokens + prompt_tokens
+        }
+    })
+
 @pytest.fixture(autouse=True)
 def mock_openai():
     """Mock OpenAI client to prevent real API calls"""
@@ -42,12 +66,10 @@ def mock_file_processor():
         mock_run_tool.return_value = {"content": "processed content"}
         yield mock_run_tool
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_tool_runner():
-    mock = MagicMock(spec=ToolRunner)
-    mock.execute_tool_call = AsyncMock()
-    mock.get_tool_attributes = MagicMock(return_value=None)
-    return mock
+    """Spec'd ToolRunner mock built once per module; reset before each test by reset_shared_mocks."""
+    return MagicMock(spec=ToolRunner)
 
 @pytest.fixture
 def mock_thread_store():
@@ -82,10 +104,20 @@ def mock_thread_store():
 def mock_wandb():
     return MagicMock()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_prompt():
+    """Prompt mock built once per module; reset before each test by reset_shared_mocks."""
     return MagicMock()
 
+@pytest.fixture(autouse=True)
+def reset_shared_mocks(mock_tool_runner, mock_prompt):
+    """Clear calls and configured behaviour on the module-scoped mocks before each test"""
+    mock_tool_runner.reset_mock(return_value=True, side_effect=True)
+    mock_tool_runner.execute_tool_call = AsyncMock()
+    mock_tool_runner.get_tool_attributes = MagicMock(return_value=None)
+    mock_prompt.reset_mock(return_value=True, side_effect=True)
+    yield
+
 @pytest.fixture
 def mock_env_vars():
     return {
@@ -102,6 +134,16 @@ def thread():
         metadata={}
     )
 
+@pytest.fixture(scope="session")
+def conv_thread_template():
+    """Thread template shared across the go() tests; copy it via conv_thread"""
+    return Thread(id="test-conv", title="Test Thread")
+
+@pytest.fixture
+def conv_thread(conv_thread_template):
+    """Create a fresh copy of the go() test thread"""
+    return conv_thread_template.model_copy(deep=True)
+
 @pytest.fixture
 def agent(mock_tool_runner, mock_thread_store, mock_openai, mock_wandb, mock_litellm, mock_prompt, mock_file_processor, mock_env_vars):
     """Create a test agent"""
@@ -136,9 +178,9 @@ async def test_go_thread_not_found(agent, mock_thread_store):
         await agent.go("test-conv")
 
 @pytest.mark.asyncio
-async def test_go_max_recursion(agent, mock_thread_store):
+async def test_go_max_recursion(agent, mock_thread_store, conv_thread):
     """Test go() with maximum iteration count reached"""
-    thread = Thread(id="test-conv", title="Test Thread")
+    thread = conv_thread
     mock_thread_store.get.return_value = thread
     agent._iteration_count = agent.max_tool_iterations
     
@@ -147,30 +189,20 @@ async def test_go_max_recursion(agent, mock_thread_store):
     assert len(new_messages) == 1
     assert new_messages[0].role == "assistant"
     assert new_messages[0].content == "Maximum tool iteration count reached. Stopping further tool calls."
-    mock_thread_store.save.assert_called_once_with(result_thread)
+    assert mock_thread_store.save.call_count == 1
+    assert mock_thread_store.save.call_args.args[0] is result_thread
 
 @pytest.mark.asyncio
-async def test_go_no_tool_calls(agent, mock_thread_store, mock_prompt, mock_litellm):
+async def test_go_no_tool_calls(agent, mock_thread_store, mock_prompt, mock_litellm, conv_thread):
     """Test go() with a response that doesn't include tool calls"""
-    thread = Thread(id="test-conv", title="Test Thread")
+    thread = conv_thread
     mock_prompt.system_prompt.return_value = "Test system prompt"
     thread.messages = []
     thread.ensure_system_prompt("Test system prompt")
     mock_thread_store.get.return_value = thread
     agent._iteration_count = 0
 
-    # Create a mock response
-    mock_response = MagicMock()
-    mock_response.id = "test-id"
-    mock_response.choices = [MagicMock()]
-    mock_response.choices[0].finish_reason = "stop"
-    mock_response.choices[0].index = 0
-    mock_response.choices[0].message.content = "Test response"
-    mock_response.choices[0].message.role = "assistant"
-    mock_response.model = "gpt-4"
-    mock_response.usage.completion_tokens = 10
-    mock_response.usage.prompt_tokens = 20
-    mock_response.usage.total_tokens = 30
+    mock_response = _mk_completion("Test response")
 
     # Mock the weave operation by patching _get_completion with a dummy object
     mock_weave_call = MagicMock()
@@ -194,13 +226,13 @@ async def test_go_no_tool_calls(agent, mock_thread_store, mock_prompt, mock_lite
     assert "metrics" in new_messages[0].model_dump()
     assert "timing" in new_messages[0].metrics
     assert "usage" in new_messages[0].metrics
-    mock_thread_store.save.assert_called_with(result_thread)
+    assert mock_thread_store.save.call_args.args[0] is result_thread
     assert agent._iteration_count == 0
 
 @pytest.mark.asyncio
-async def test_go_with_tool_calls(agent, mock_thread_store, mock_prompt, mock_litellm):
+async def test_go_with_tool_calls(agent, mock_thread_store, mock_prompt, mock_litellm, conv_thread):
     """Test go() with tool calls"""
-    thread = Thread(id="test-conv", title="Test Thread")
+    thread = conv_thread
     mock_prompt.system_prompt.return_value = "Test system prompt"
     thread.messages = []
     thread.ensure_system_prompt("Test system prompt")
@@ -208,52 +240,18 @@ async def test_go_with_tool_calls(agent, mock_thread_store, mock_prompt, mock_li
     agent._iteration_count = 0
 
     # Create a mock response with tool calls
-    tool_response = ModelResponse(**{
-        "id": "test-id",
-        "choices": [{
-            "finish_reason": "tool_calls",
-            "index": 0,
-            "message": {
-                "content": "Let me help you with that",
-                "role": "assistant",
-                "tool_calls": [{
-                    "id": "test-call-id",
-                    "type": "function",
-                    "function": {
-                        "name": "test-tool",
-                        "arguments": '{"arg": "value"}'
-                    }
-                }]
-            }
-        }],
-        "model": "gpt-4",
-        "usage": {
-            "completion_tokens": 10,
-            "prompt_tokens": 20,
-            "total_tokens": 30
+    tool_response = _mk_completion("Let me help you with that", tool_calls=[{
+        "id": "test-call-id",
+        "type": "function",
+        "function": {
+            "name": "test-tool",
+            "arguments": '{"arg": "value"}'
         }
-    })
+    }])
     tool_response.choices[0].message = SimpleNamespace(**vars(tool_response.choices[0].message))
 
     # Create a mock response for after tool execution
-    final_response = ModelResponse(**{
-        "id": "test-id-2",
-        "choices": [{
-            "finish_reason": "stop",
-            "index": 0,
-            "message": {
-                "content": "Here's what I found",
-                "role": "assistant",
-                "tool_calls": None
-            }
-        }],
-        "model": "gpt-4",
-        "usage": {
-            "completion_tokens": 5,
-            "prompt_tokens": 25,
-            "total_tokens": 30
-        }
-    })
+    final_response = _mk_completion("Here's what I found", response_id="test-id-2", completion_tokens=5, prompt_tokens=25)
 
     # Patch the _get_completion method
     mock_weave_call = MagicMock()
@@ -452,7 +450,8 @@ async def test_handle_max_iterations(agent, mock_thread_store):
     assert len(filtered_messages) == 1
     assert filtered_messages[0].role == "assistant"
     assert filtered_messages[0].content == "Maximum tool iteration count reached. Stopping further tool calls."
-    mock_thread_store.save.assert_called_once_with(result_thread)
+    assert mock_thread_store.save.call_count == 1
+    assert mock_thread_store.save.call_args.args[0] is result_thread
 
 @pytest.mark.asyncio
 async def test_get_thread_direct(agent):
@@ -550,9 +549,9 @@ async def test_serialize_tool_calls():
     assert agent._serialize_tool_calls(None) is None
 
 @pytest.mark.asyncio
-async def test_go_with_weave_metrics(agent, mock_thread_store, mock_prompt):
+async def test_go_with_weave_metrics(agent, mock_thread_store, mock_prompt, conv_thread):
     """Test go() with weave metrics tracking"""
-    thread = Thread(id="test-conv", title="Test Thread")
+    thread = conv_thread
     thread.messages = []
     thread.ensure_system_prompt("Test system prompt")
     mock_thread_store.get.return_value = thread
@@ -631,9 +630,9 @@ async def test_get_thread_no_store():
     assert str(exc_info.value) == "Thread store is required when passing thread ID"
 
 @pytest.mark.asyncio
-async def test_go_with_multiple_tool_call_iterations(agent, mock_thread_store, mock_prompt, mock_litellm):
+async def test_go_with_multiple_tool_call_iterations(agent, mock_thread_store, mock_prompt, mock_litellm, conv_thread):
     """Test go() with multiple iterations of tool calls"""
-    thread = Thread(id="test-conv", title="Test Thread")
+    thread = conv_thread
     mock_prompt.system_prompt.return_value = "Test system prompt"
     thread.messages = []
     thread.ensure_system_prompt("Test system prompt")
@@ -792,9 +791,9 @@ async def test_go_with_multiple_tool_call_iterations(agent, mock_thread_store, m
     assert messages[5].content == "Here's what I found"
 
 @pytest.mark.asyncio
-async def test_go_with_tool_calls_no_content(agent, mock_thread_store, mock_prompt, mock_litellm):
+async def test_go_with_tool_calls_no_content(agent, mock_thread_store, mock_prompt, mock_litellm, conv_thread):
     """Test go() with a response that includes only tool calls (no content)"""
-    thread = Thread(id="test-conv", title="Test Thread")
+    thread = conv_thread
     mock_prompt.system_prompt.return_value = "Test system prompt"
     thread.messages = []
     thread.ensure_system_prompt("Test system prompt")
@@ -984,16 +983,12 @@ async def test_process_tool_call_with_image_attachment():
         }
     }
 
-    # Create base64 encoded content
-    test_image_bytes = b"test image content"
-    encoded_content = base64.b64encode(test_image_bytes).decode('utf-8')
-
     # Mock the tool execution result with an image attachment
     mock_result = (
         "Image generated successfully",
         [{
             "filename": "test.png",
-            "content": encoded_content,  # Already base64 encoded
+            "content": _TEST_IMAGE_B64,  # Already base64 encoded
             "mime_type": "image/png",
             "description": "A test image"
         }]
@@ -1009,7 +1004,7 @@ async def test_process_tool_call_with_image_attachment():
         assert len(message.attachments) == 1
         attachment = message.attachments[0]
         assert attachment.filename == "test.png"
-        assert attachment.content == encoded_content  # Compare with encoded content
+        assert attachment.content == _TEST_IMAGE_B64  # Compare with encoded content
         assert attachment.mime_type == "image/png"
 
 @pytest.mark.asyncio
@@ -1025,10 +1020,6 @@ async def test_go_with_tool_returning_image():
     # Create agent with mock thread store
     agent = Agent(thread_store=mock_thread_store)
 
-    # Create base64 encoded content
-    test_image_bytes = b"test image content"
-    encoded_content = base64.b64encode(test_image_bytes).decode('utf-8')
-
     # First response with tool call
     tool_response = ModelResponse(**{
         "id": "test-id",
@@ -1087,7 +1078,7 @@ async def test_go_with_tool_returning_image():
     with patch.object(agent, '_handle_tool_execution', new_callable=AsyncMock) as mock_execute:
         mock_execute.return_value = ("Image generated successfully", [{
             "filename": "test.png",
-            "content": encoded_content,
+            "content": _TEST_IMAGE_B64,
             "mime_type": "image/png"
         }])
 
@@ -1100,7 +1091,7 @@ async def test_go_with_tool_returning_image():
         assert new_messages[0].content == "Let me generate that image for you"
         assert new_messages[1].role == "tool"  # Tool response with image
         assert len(new_messages[1].attachments) == 1
-        assert new_messages[1].attachments[0].content == encoded_content
+        assert new_messages[1].attachments[0].content == _TEST_IMAGE_B64
         assert new_messages[2].role == "assistant"  # Final message
         assert new_messages[2].content == "Here's your generated image"
 
@@ -9,6 +9,9 @@ import json
 from types import SimpleNamespace
 from tyler.database.thread_store import ThreadStore
 
+# Result returned by the mocked test_tool; the agent only stringifies it, so tests share one dict
+TOOL_RESULT = {"name": "test_tool", "content": "Tool result"}
+
 def create_streaming_chunk(content=None, tool_calls=None, role="assistant", usage=None):
     """Helper function to create streaming chunks with proper structure"""
     delta = {"role": role}
@@ -275,10 +278,7 @@ async def test_go_stream_max_iterations():
     with patch.object(agent, '_get_completion') as mock_get_completion, \
          patch('tyler.models.agent.tool_runner') as mock_tool_runner:
         mock_get_completion.call.return_value = (async_generator(chunks), mock_weave_call)
-        mock_tool_runner.execute_tool_call = AsyncMock(return_value={
-            "name": "test_tool",
-            "content": "Tool result"
-        })
+        mock_tool_runner.execute_tool_call = AsyncMock(return_value=TOOL_RESULT)
         
         updates = []
         async for update in agent.go_stream(thread):
@@ -399,10 +399,7 @@ async def test_go_stream_tool_metrics():
     with patch.object(agent, '_get_completion') as mock_get_completion, \
          patch('tyler.models.agent.tool_runner') as mock_tool_runner:
         mock_get_completion.call.return_value = (async_generator(chunks), mock_weave_call)
-        mock_tool_runner.execute_tool_call = AsyncMock(return_value={
-            "name": "test_tool",
-            "content": "Tool result"
-        })
+        mock_tool_runner.execute_tool_call = AsyncMock(return_value=TOOL_RESULT)
         
         updates = []
         async for update in agent.go_stream(thread):
@@ -461,10 +458,7 @@ async def test_go_stream_multiple_messages_metrics():
             (async_generator(first_chunks), mock_weave_call),
             (async_generator(second_chunks), mock_weave_call)
         ]
-        mock_tool_runner.execute_tool_call = AsyncMock(return_value={
-            "name": "test_tool",
-            "content": "Tool result"
-        })
+        mock_tool_runner.execute_tool_call = AsyncMock(return_value=TOOL_RESULT)
         
         updates = []
         async for update in agent.go_stream(thread):
@@ -527,10 +521,7 @@ async def test_go_stream_object_format_tool_calls():
     with patch.object(agent, '_get_completion') as mock_get_completion, \
          patch('tyler.models.agent.tool_runner') as mock_tool_runner:
         mock_get_completion.call.return_value = (async_generator([chunk]), mock_weave_call)
-        mock_tool_runner.execute_tool_call = AsyncMock(return_value={
-            "name": "test_tool",
-            "content": "Tool result"
-        })
+        mock_tool_runner.execute_tool_call = AsyncMock(return_value=TOOL_RESULT)
 
         updates = []
         async for update in agent.go_stream(thread):
@@ -573,10 +564,7 @@ async def test_go_stream_object_format_tool_call_updates():
     with patch.object(agent, '_get_completion') as mock_get_completion, \
          patch('tyler.models.agent.tool_runner') as mock_tool_runner:
         mock_get_completion.call.return_value = (async_generator(chunks), mock_weave_call)
-        mock_tool_runner.execute_tool_call = AsyncMock(return_value={
-            "name": "test_tool",
-            "content": "Tool result"
-        })
+        mock_tool_runner.execute_tool_call = AsyncMock(return_value=TOOL_RESULT)
         
         updates = []
         async for update in agent.go_stream(thread):
@@ -653,10 +641,7 @@ async def test_go_stream_empty_arguments():
     with patch.object(agent, '_get_completion') as mock_get_completion, \
          patch('tyler.models.agent.tool_runner') as mock_tool_runner:
         mock_get_completion.call.return_value = (async_generator(chunks), mock_weave_call)
-        mock_tool_runner.execute_tool_call = AsyncMock(return_value={
-            "name": "test_tool",
-            "content": "Tool result"
-        })
+        mock_tool_runner.execute_tool_call = AsyncMock(return_value=TOOL_RESULT)
         
         updates = []
         async for update in agent.go_stream(thread):
@@ -698,10 +683,7 @@ async def test_go_stream_thread_store_save():
     with patch.object(agent, '_get_completion') as mock_get_completion, \
          patch('tyler.models.agent.tool_runner') as mock_tool_runner:
         mock_get_completion.call.return_value = (async_generator(chunks), mock_weave_call)
-        mock_tool_runner.execute_tool_call = AsyncMock(return_value={
-            "name": "test_tool",
-            "content": "Tool result"
-        })
+        mock_tool_runner.execute_tool_call = AsyncMock(return_value=TOOL_RESULT)
         
         updates = []
         async for update in agent.go_stream(thread):
@@ -840,10 +822,7 @@ async def test_go_stream_tool_call_with_attributes():
             "type": "test",
             "category": "utility"
         }
-        mock_tool_runner.execute_tool_call = AsyncMock(return_value={
-            "name": "test_tool",
-            "content": "Tool result"
-        })
+        mock_tool_runner.execute_tool_call = AsyncMock(return_value=TOOL_RESULT)
         
         updates = []
         async for update in agent.go_stream(thread):
@@ -123,54 +123,32 @@ async def test_agent_with_custom_tool():
     assert attributes == {"type": "utility", "category": "test"}
 
 @pytest.mark.asyncio
-async def test_agent_with_invalid_tool_type():
-    """Test that agent raises error for invalid tool type"""
-    # Try to create agent with invalid tool type (not string or dict)
-    with pytest.raises(ValueError) as excinfo:
-        Agent(
-            model_name="gpt-4o",
-            purpose="test",
-            tools=[123]  # Invalid tool type
-        )
-    
-    # Check that the error message contains information about invalid type
-    assert "Invalid tool type" in str(excinfo.value) or "type" in str(excinfo.value)
-
-@pytest.mark.asyncio
-async def test_agent_with_missing_tool_module():
-    """Test that agent raises error for missing tool module"""
-    # Try to create agent with non-existent tool module
-    with pytest.raises(ValueError) as excinfo:
-        Agent(
-            model_name="gpt-4o",
-            purpose="test",
-            tools=["non_existent_module"]  # Non-existent module
-        )
-    
-    # Check that the error message contains information about the missing module
-    assert "non_existent_module" in str(excinfo.value)
-
-@pytest.mark.asyncio
-async def test_agent_with_custom_tool_missing_keys():
-    """Test that agent raises error for custom tool with missing keys"""
-    # Define an invalid custom tool missing implementation
-    invalid_tool = {
-        "definition": {
-            "function": {
-                "name": "invalid-tool",
-                "description": "An invalid tool",
-                "parameters": {}
+@pytest.mark.parametrize("tool, match", [
+    # Not a string or dict (rejected by model validation before tool loading)
+    (123, "type"),
+    # Non-existent built-in module
+    ("non_existent_module", "non_existent_module"),
+    # Custom tool missing its implementation
+    (
+        {
+            "definition": {
+                "function": {
+                    "name": "invalid-tool",
+                    "description": "An invalid tool",
+                    "parameters": {}
+                }
             }
-        }
-        # Missing implementation key
-    }
-    
-    # Try to create agent with invalid tool
-    with pytest.raises(ValueError, match="Custom tools must have 'definition' and 'implementation' keys"):
+        },
+        "Custom tools must have 'definition' and 'implementation' keys"
+    ),
+], ids=["invalid_type", "missing_module", "custom_tool_missing_keys"])
+async def test_agent_with_invalid_tool(tool, match):
+    """Test that agent raises error for tools it cannot load"""
+    with pytest.raises(ValueError, match=match):
         Agent(
             model_name="gpt-4o",
             purpose="test",
-            tools=[invalid_tool]
+            tools=[tool]
         )
 
 @pytest.mark.asyncio
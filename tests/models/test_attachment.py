@@ -1,5 +1,6 @@
 import pytest
 from tyler.models.attachment import Attachment
+from tyler.storage.file_store import FileStore
 import base64
 import magic
 from datetime import datetime, UTC
@@ -151,7 +152,7 @@ async def test_ensure_stored():
 
     # Mock the file store
     with patch('tyler.storage.get_file_store') as mock_get_store, \
-         patch('tyler.storage.file_store.FileStore.get_file_url', return_value="/files//path/to/stored/file.txt"):
+         patch.object(FileStore, 'get_file_url', return_value="/files//path/to/stored/file.txt"):
         mock_store = Mock()
         mock_store.save = AsyncMock(return_value={
             'id': 'file-123',
@@ -176,7 +177,7 @@ async def test_ensure_stored():
 def test_update_attributes_with_url():
     """Test updating attributes with URL after storage."""
     # Mock FileStore.get_file_url
-    with patch('tyler.storage.file_store.FileStore.get_file_url', return_value="/files//path/to/file.txt"):
+    with patch.object(FileStore, 'get_file_url', return_value="/files//path/to/file.txt"):
         # Test with no attributes
         attachment = Attachment(
             filename="test.txt",
@@ -443,7 +444,7 @@ async def test_process_attachment_pdf():
          patch('magic.from_buffer', return_value='application/pdf') as mock_magic, \
          patch('tyler.storage.get_file_store') as mock_get_store, \
          patch('pypdf.PdfReader', return_value=mock_pdf_reader) as mock_pdf_reader_class, \
-         patch('tyler.storage.file_store.FileStore.get_file_url', return_value="/files//path/to/stored/test.pdf"):
+         patch.object(FileStore, 'get_file_url', return_value="/files//path/to/stored/test.pdf"):
         
         # Setup mocks
         mock_get_content.return_value = content
@@ -498,7 +499,7 @@ async def test_filename_update_after_storage():
 
     # Mock the file store
     with patch('tyler.storage.get_file_store') as mock_get_store, \
-         patch('tyler.storage.file_store.FileStore.get_file_url', return_value=f"/files/{storage_path}"):
+         patch.object(FileStore, 'get_file_url', return_value=f"/files/{storage_path}"):
         mock_store = Mock()
         mock_store.save = AsyncMock(return_value={
             'id': 'file-123',
@@ -2,11 +2,16 @@ import pytest
 from datetime import datetime, UTC
 from tyler.models.message import Message, TextContent, ImageContent
 from tyler.models.attachment import Attachment
+from tyler.storage.file_store import FileStore
 import json
 import base64
 from unittest.mock import patch, Mock, AsyncMock
 import pydantic
 
+def _file_url(storage_path):
+    """Stand-in for FileStore.get_file_url with a base path of /files, keyed on the path rather than call order"""
+    return f"/files/{storage_path}"
+
 @pytest.fixture
 def sample_message():
     """Create a sample message for testing."""
@@ -194,7 +199,7 @@ def test_message_with_attachments():
     )
 
     # Test chat completion format with user attachments
-    with patch('tyler.storage.file_store.FileStore.get_base_path', return_value="/files"):
+    with patch.object(FileStore, 'get_base_path', return_value="/files"):
         chat_msg = user_message.to_chat_completion_message()
         assert isinstance(chat_msg["content"], str)
         assert chat_msg["content"] == "Here are some files"
@@ -206,16 +211,13 @@ def test_message_with_attachments():
         attachments=[text_attachment]
     )
     
-    with patch('tyler.storage.file_store.FileStore.get_base_path', return_value="/files"):
+    with patch.object(FileStore, 'get_base_path', return_value="/files"):
         chat_msg = user_text_only.to_chat_completion_message()
         assert isinstance(chat_msg["content"], str)
         assert chat_msg["content"] == "Here's a text file"
 
     # Mock FileStore.get_file_url and get_base_path for the assistant message test
-    with patch('tyler.storage.file_store.FileStore.get_file_url', side_effect=[
-        "/files//path/to/test.txt",
-        "/files//path/to/test.jpg"
-    ]), patch('tyler.storage.file_store.FileStore.get_base_path', return_value="/files"):
+    with patch.object(FileStore, 'get_file_url', side_effect=_file_url), patch.object(FileStore, 'get_base_path', return_value="/files"):
         # Test assistant message with attachments
         assistant_message = Message(
             role="assistant",
@@ -240,8 +242,8 @@ def test_message_with_attachments():
         attachments=[text_attachment]
     )
     
-    with patch('tyler.storage.file_store.FileStore.get_file_url', return_value="/files/path/to/test.txt"), \
-         patch('tyler.storage.file_store.FileStore.get_base_path', return_value="/files"):
+    with patch.object(FileStore, 'get_file_url', return_value="/files/path/to/test.txt"), \
+         patch.object(FileStore, 'get_base_path', return_value="/files"):
         chat_msg = tool_message.to_chat_completion_message()
         expected = "Tool result\n\n[File: /files/path/to/test.txt (text/plain)]"
         assert chat_msg["content"] == expected
@@ -265,14 +267,14 @@ def test_message_with_error_attachments():
         attachments=[error_attachment]
     )
     
-    with patch('tyler.storage.file_store.FileStore.get_base_path', return_value="/files"):
+    with patch.object(FileStore, 'get_base_path', return_value="/files"):
         chat_msg = user_message.to_chat_completion_message()
         assert isinstance(chat_msg["content"], str)
         assert chat_msg["content"] == "Here's a problematic file"
 
     # Mock FileStore.get_file_url and get_base_path for the assistant message test
-    with patch('tyler.storage.file_store.FileStore.get_file_url', return_value="/files//path/to/error.txt"), \
-         patch('tyler.storage.file_store.FileStore.get_base_path', return_value="/files"):
+    with patch.object(FileStore, 'get_file_url', return_value="/files//path/to/error.txt"), \
+         patch.object(FileStore, 'get_base_path', return_value="/files"):
         # Test assistant message with error attachment
         assistant_message = Message(
             role="assistant",
@@ -318,7 +320,7 @@ def test_message_with_multiple_image_attachments():
         attachments=[image1, image2]
     )
     
-    with patch('tyler.storage.file_store.FileStore.get_base_path', return_value="/files"):
+    with patch.object(FileStore, 'get_base_path', return_value="/files"):
         chat_msg = user_message.to_chat_completion_message()
         assert isinstance(chat_msg["content"], str)
         assert chat_msg["content"] == "Here are multiple images"
@@ -353,7 +355,7 @@ def test_message_with_mixed_content_types():
         attachments=[image, text]
     )
     
-    with patch('tyler.storage.file_store.FileStore.get_base_path', return_value="/files"):
+    with patch.object(FileStore, 'get_base_path', return_value="/files"):
         chat_msg = user_message.to_chat_completion_message()
         assert isinstance(chat_msg["content"], str)
         assert chat_msg["content"] == "Here are mixed files"
@@ -689,11 +691,8 @@ async def test_ensure_attachments_stored():
 
     # Mock the file store, FileStore.get_file_url, and FileStore.get_base_path
     with patch('tyler.storage.get_file_store') as mock_get_store, \
-         patch('tyler.storage.file_store.FileStore.get_file_url', side_effect=[
-             "/files//path/to/stored/file1.txt",
-             "/files//path/to/stored/file2.txt"
-         ]), \
-         patch('tyler.storage.file_store.FileStore.get_base_path', return_value="/files"):
+         patch.object(FileStore, 'get_file_url', side_effect=_file_url), \
+         patch.object(FileStore, 'get_base_path', return_value="/files"):
         mock_store = Mock()
         # Configure the mock to return different values for each call
         mock_store.save = AsyncMock(side_effect=[
@@ -754,8 +753,8 @@ async def test_ensure_attachments_stored_with_force():
 
     # Mock the file store, FileStore.get_file_url, and FileStore.get_base_path
     with patch('tyler.storage.get_file_store') as mock_get_store, \
-         patch('tyler.storage.file_store.FileStore.get_file_url', return_value="/files//path/to/new/file.txt"), \
-         patch('tyler.storage.file_store.FileStore.get_base_path', return_value="/files"):
+         patch.object(FileStore, 'get_file_url', return_value="/files//path/to/new/file.txt"), \
+         patch.object(FileStore, 'get_base_path', return_value="/files"):
         mock_store = Mock()
         mock_store.save = AsyncMock(return_value={
             'id': 'new-file-id',
@@ -804,8 +803,8 @@ async def test_ensure_attachments_stored_with_existing_processed_content():
 
     # Mock the file store, FileStore.get_file_url, and FileStore.get_base_path
     with patch('tyler.storage.get_file_store') as mock_get_store, \
-         patch('tyler.storage.file_store.FileStore.get_file_url', return_value="/files//path/to/stored/file.txt"), \
-         patch('tyler.storage.file_store.FileStore.get_base_path', return_value="/files"):
+         patch.object(FileStore, 'get_file_url', return_value="/files//path/to/stored/file.txt"), \
+         patch.object(FileStore, 'get_base_path', return_value="/files"):
         mock_store = Mock()
         mock_store.save = AsyncMock(return_value={
             'id': 'file-123',
@@ -19,7 +19,11 @@ def mock_registry():
     registry = Registry()
     registry.list_agents = MagicMock(return_value=["agent1", "agent2"])
     registry.has_agent = MagicMock(side_effect=lambda x: x in ["agent1", "agent2"])
-    registry.get_agent = MagicMock()
+    _agent_cache = {
+        "agent1": MagicMock(purpose="Test purpose"),
+        "agent2": MagicMock(purpose="Test purpose")
+    }
+    registry.get_agent = MagicMock(side_effect=_agent_cache.get)
     return registry
 
 @pytest.fixture
@@ -92,7 +96,6 @@ async def test_route_with_mention(router_agent, mock_thread_store, mock_registry
         Message(role="user", content="Hey @agent1, help me")
     ]
     mock_thread_store.get.return_value = thread
-    mock_registry.get_agent.return_value = True
     
     result = await router_agent.route("test-thread")
     assert result == "agent1"
@@ -5,20 +5,112 @@ from tyler.models.message import Message
 from tyler.models.attachment import Attachment
 from unittest.mock import patch, AsyncMock
 import os
+import base64
+import json
 from litellm import ModelResponse
+from tests.helpers import _msg, _trusted_rebuild
 
-@pytest.fixture
+# Shared metrics test data; tests must not modify these
+_GPT4O_METRICS_15 = {"model": "gpt-4o", "usage": {"completion_tokens": 10, "prompt_tokens": 5, "total_tokens": 15}}
+_GPT35_METRICS_35 = {"model": "gpt-3.5-turbo", "usage": {"completion_tokens": 20, "prompt_tokens": 15, "total_tokens": 35}}
+_GPT4_METRICS_150 = {"model": "gpt-4", "usage": {"completion_tokens": 100, "prompt_tokens": 50, "total_tokens": 150}}
+_GPT4_METRICS_225 = {"model": "gpt-4", "usage": {"completion_tokens": 150, "prompt_tokens": 75, "total_tokens": 225}}
+
+@pytest.fixture(scope="session")
 def sample_thread():
-    """Create a sample thread for testing."""
+    """Create a sample thread for testing. Shared across tests, so treat as read-only."""
     thread = Thread(
         id="test-thread",
         title="Test Thread",
         attributes={"category": "test"},
         source={"name": "slack", "channel": "general"}
     )
-    thread.add_message(Message(role="system", content="You are a helpful assistant"))
-    thread.add_message(Message(role="user", content="Hello"))
-    thread.add_message(Message(role="assistant", content="Hi there!"))
+    thread.add_messages([
+        Message(role="system", content="You are a helpful assistant"),
+        Message(role="user", content="Hello"),
+        Message(role="assistant", content="Hi there!")
+    ])
+    return thread
+
+@pytest.fixture
+def mutable_sample_thread(sample_thread):
+    """Create a per-test copy of sample_thread that is safe to modify."""
+    return sample_thread.model_copy(deep=True)
+
+@pytest.fixture(scope="session")
+def thread_with_token_metrics():
+    """Create a read-only thread with token usage from two models."""
+    thread = Thread(id="test-thread")
+    thread.add_message(_msg(
+        role="user",
+        content="Hello",
+        metrics=_GPT4O_METRICS_15
+    ))
+    thread.add_message(_msg(
+        role="assistant",
+        content="Hi there!",
+        metrics=_GPT35_METRICS_35
+    ))
+    return thread
+
+@pytest.fixture(scope="session")
+def thread_with_timing():
+    """Create a read-only thread with message timing metrics."""
+    thread = Thread(id="test-thread")
+    thread.add_message(_msg(
+        role="user",
+        content="Hello",
+        metrics={
+            "timing": {
+                "started_at": "2024-02-07T00:00:00+00:00",
+                "ended_at": "2024-02-07T00:00:01+00:00",
+                "latency": 1000.0  # 1 second = 1000 milliseconds
+            }
+        }
+    ))
+    thread.add_message(_msg(
+        role="assistant",
+        content="Hi there!",
+        metrics={
+            "timing": {
+                "started_at": "2024-02-07T00:00:02+00:00",
+                "ended_at": "2024-02-07T00:00:04+00:00",
+                "latency": 2000.0  # 2 seconds = 2000 milliseconds
+            }
+        }
+    ))
+    return thread
+
+@pytest.fixture(scope="session")
+def thread_with_tool_calls():
+    """Create a read-only thread with assistant tool calls."""
+    thread = Thread(id="test-thread")
+    tool_call1 = {
+        "id": "call_123",
+        "type": "function",
+        "function": {
+            "name": "test_tool",
+            "arguments": '{"arg": "value"}'
+        }
+    }
+    tool_call2 = {
+        "id": "call_456",
+        "type": "function",
+        "function": {
+            "name": "another_tool",
+            "arguments": '{"arg": "value"}'
+        }
+    }
+    thread.add_message(_msg(
+        role="assistant",
+        content="Using tools",
+        tool_calls=[tool_call1, tool_call2]
+    ))
+    thread.add_message(_msg(
+        role="assistant",
+        content="Using tool again",
+        tool_calls=[tool_call1]
+    ))
     return thread
 
 def test_create_thread():
@@ -44,6 +136,20 @@ def test_add_message():
     assert thread.messages[0].content == "Hello"
     assert thread.messages[0].sequence == 1
 
+def test_add_messages():
+    """Test adding several messages to a thread at once"""
+    thread = Thread(id="test-thread")
+    thread.add_message(Message(role="user", content="Hello"))
+    
+    thread.add_messages([
+        Message(role="assistant", content="Hi there!"),
+        Message(role="system", content="System message"),
+        Message(role="user", content="How are you?")
+    ])
+    
+    assert [m.role for m in thread.messages] == ["system", "user", "assistant", "user"]
+    assert [m.sequence for m in thread.messages] == [0, 1, 2, 3]
+
 def test_thread_serialization(sample_thread):
     """Test thread serialization to/from dict"""
     # Test model_dump()
@@ -59,8 +165,8 @@ def test_thread_serialization(sample_thread):
     assert isinstance(data["created_at"], datetime)
     assert isinstance(data["updated_at"], datetime)
     
-    # Test model_validate()
-    new_thread = Thread.model_validate(data)
+    # Rebuild from trusted model_dump() output
+    new_thread = _trusted_rebuild(data)
     assert new_thread.id == sample_thread.id
     assert new_thread.title == sample_thread.title
     assert new_thread.attributes == sample_thread.attributes
@@ -71,6 +177,107 @@ def test_thread_serialization(sample_thread):
         assert new_msg.content == orig_msg.content
         assert new_msg.sequence == orig_msg.sequence
 
+@pytest.mark.parametrize("mode,exclude_unset", [
+    ("python", False),
+    ("python", True),
+    ("json", False)
+])
+def test_thread_serialization_modes(sample_thread, mode, exclude_unset):
+    """Test thread round-trips through model_dump() in each serialization mode"""
+    data = sample_thread.model_dump(mode=mode, exclude_unset=exclude_unset)
+    assert len(data["messages"]) == 3
+    
+    new_thread = Thread.model_validate(data)
+    assert new_thread.model_dump(mode=mode, exclude_unset=exclude_unset) == data
+
+def test_thread_wire_round_trip(mutable_sample_thread):
+    """Test thread round-trips through the msgspec wire format"""
+    pytest.importorskip("msgspec")
+    thread = mutable_sample_thread
+    thread.add_message(Message(
+        role="user",
+        content="Message with attachment",
+        attachments=[Attachment(filename="test.txt", content=b"Test content", mime_type="text/plain")]
+    ))
+    
+    data = thread.to_wire()
+    assert isinstance(data, bytes)
+    
+    new_thread = Thread.from_wire(data)
+    assert new_thread.model_dump(exclude={"messages"}) == thread.model_dump(exclude={"messages"})
+    assert len(new_thread.messages) == len(thread.messages)
+    for orig_msg, new_msg in zip(thread.messages, new_thread.messages):
+        assert new_msg.id == orig_msg.id
+        assert new_msg.role == orig_msg.role
+        assert new_msg.content == orig_msg.content
+        assert new_msg.sequence == orig_msg.sequence
+        assert new_msg.timestamp == orig_msg.timestamp
+        assert new_msg.metrics == orig_msg.metrics
+    
+    # Attachment bytes are carried as base64 text
+    attachment = new_thread.messages[-1].attachments[0]
+    assert attachment.filename == "test.txt"
+    assert attachment.mime_type == "text/plain"
+    assert base64.b64decode(attachment.content) == b"Test content"
+
+def _wire_payload(message):
+    """JSON bytes for a single-message thread in the wire format"""
+    return json.dumps({
+        "id": "thread-1",
+        "created_at": "2024-01-01T00:00:00+00:00",
+        "updated_at": "2024-01-01T00:00:00+00:00",
+        "messages": [{"id": "msg-1", "timestamp": "2024-01-01T00:00:00+00:00", **message}],
+    }).encode()
+
+@pytest.mark.parametrize("message", [
+    pytest.param({"role": "hacker", "content": "hi"}, id="invalid_role"),
+    pytest.param({"role": "tool", "content": "result"}, id="tool_without_tool_call_id"),
+    pytest.param(
+        {"role": "user", "content": "hi", "attachments": [{"filename": "a.txt", "status": "bogus"}]},
+        id="invalid_attachment_status",
+    ),
+    pytest.param({"role": "assistant", "tool_calls": ["not-a-dict"]}, id="tool_call_not_dict"),
+    pytest.param(
+        {"role": "assistant", "tool_calls": [{"id": "call-1", "type": "function"}]},
+        id="tool_call_without_function",
+    ),
+    pytest.param(
+        {"role": "assistant", "tool_calls": [{"id": "call-1", "type": "function", "function": {"name": "f"}}]},
+        id="tool_call_function_without_arguments",
+    ),
+])
+def test_thread_from_wire_rejects_invalid_messages(message):
+    """Test from_wire enforces the same message rules as model validation"""
+    msgspec = pytest.importorskip("msgspec")
+    with pytest.raises(msgspec.ValidationError):
+        Thread.from_wire(_wire_payload(message))
+
+def test_thread_from_wire_missing_metrics_uses_default():
+    """Test a message without metrics gets the Message default metrics structure"""
+    pytest.importorskip("msgspec")
+    thread = Thread.from_wire(_wire_payload({"role": "user", "content": "hi"}))
+    assert thread.messages[0].metrics == Message(role="user", content="hi").metrics
+
+def test_thread_from_wire_matches_model_validation():
+    """Test from_wire produces the same message as validating the same data"""
+    pytest.importorskip("msgspec")
+    message = {
+        "role": "assistant",
+        "timestamp": "2024-01-01T00:00:00",
+        "tool_calls": [{"id": "call-1", "type": "function", "function": {"name": "f", "arguments": "{}"}}],
+    }
+    thread = Thread.from_wire(_wire_payload(message))
+    expected = Message.model_validate({"id": "msg-1", **message})
+    assert thread.messages[0].timestamp == expected.timestamp
+    assert thread.messages[0].timestamp.tzinfo == UTC
+    assert thread.messages[0].tool_calls == expected.tool_calls
+
+def test_mutable_sample_thread_is_isolated(sample_thread, mutable_sample_thread):
+    """Test that modifying the mutable copy leaves the shared thread untouched"""
+    mutable_sample_thread.add_message(Message(role="user", content="Another message"))
+    assert len(mutable_sample_thread.messages) == 4
+    assert len(sample_thread.messages) == 3
+
 def test_get_messages_for_chat_completion(sample_thread):
     """Test getting messages in chat completion format"""
     messages = sample_thread.get_messages_for_chat_completion()
@@ -120,10 +327,8 @@ def test_message_sequencing():
     msg3 = Message(role="system", content="System message")
     msg4 = Message(role="user", content="Second user message")
     
-    thread.add_message(msg1)  # Should get sequence 1
-    thread.add_message(msg2)  # Should get sequence 2
-    thread.add_message(msg3)  # Should get sequence 0 and move to front
-    thread.add_message(msg4)  # Should get sequence 3
+    # msg1 -> 1, msg2 -> 2, msg3 -> 0 and moved to front, msg4 -> 3
+    thread.add_messages([msg1, msg2, msg3, msg4])
     
     # Verify sequences
     assert len(thread.messages) == 4
@@ -175,7 +380,7 @@ def test_thread_with_tool_calls():
         }
     }
     
-    assistant_msg = Message(
+    assistant_msg = _msg(
         role="assistant",
         content="Using tool",
         tool_calls=[tool_call]
@@ -183,7 +388,7 @@ def test_thread_with_tool_calls():
     thread.add_message(assistant_msg)
     
     # Add tool response
-    tool_msg = Message(
+    tool_msg = _msg(
         role="tool",
         content="Tool result",
         tool_call_id="call_123",
@@ -201,29 +406,15 @@ def test_thread_usage_stats():
     thread = Thread(id="test-thread")
     
     # Add messages with metrics
-    msg1 = Message(
+    msg1 = _msg(
         role="assistant",
         content="First response",
-        metrics={
-            "model": "gpt-4",
-            "usage": {
-                "completion_tokens": 100,
-                "prompt_tokens": 50,
-                "total_tokens": 150
-            }
-        }
+        metrics=_GPT4_METRICS_150
     )
-    msg2 = Message(
+    msg2 = _msg(
         role="assistant",
         content="Second response",
-        metrics={
-            "model": "gpt-4",
-            "usage": {
-                "completion_tokens": 150,
-                "prompt_tokens": 75,
-                "total_tokens": 225
-            }
-        }
+        metrics=_GPT4_METRICS_225
     )
     
     thread.add_message(msg1)
@@ -243,15 +434,15 @@ def test_thread_usage_stats():
 
 def test_thread_timestamps():
     """Test thread timestamp handling"""
-    thread = Thread(id="test-thread")
-    initial_created = thread.created_at
-    initial_updated = thread.updated_at
-    
-    # Wait a moment and add a message
-    import time
-    time.sleep(0.1)
-    
-    thread.add_message(Message(role="user", content="Hello"))
+    t0 = datetime(2024, 2, 7, tzinfo=UTC)
+    with patch("tyler.models.thread.datetime") as mock_datetime:
+        # created_at and updated_at defaults, then the add_message update a second later
+        mock_datetime.now.side_effect = [t0, t0, t0 + timedelta(seconds=1)]
+        thread = Thread(id="test-thread")
+        initial_created = thread.created_at
+        initial_updated = thread.updated_at
+        
+        thread.add_message(Message(role="user", content="Hello"))
     
     # created_at should not change
     assert thread.created_at == initial_created
@@ -280,9 +471,7 @@ def test_thread_message_ordering():
     msg3 = Message(role="user", content="Third", timestamp=base_time + timedelta(minutes=2))
     
     # Add in random order
-    thread.add_message(msg2)
-    thread.add_message(msg3)
-    thread.add_message(msg1)
+    thread.add_messages([msg2, msg3, msg1])
     
     # Messages should maintain sequence order
     messages = [m for m in thread.messages if m.role != "system"]
@@ -291,142 +480,112 @@ def test_thread_message_ordering():
     assert messages[1].sequence == 2
     assert messages[2].sequence == 3 
 
-def test_get_total_tokens():
+@pytest.mark.parametrize("field,expected", [
+    ("completion_tokens", 30),
+    ("prompt_tokens", 20),
+    ("total_tokens", 50)
+])
+def test_get_total_tokens(thread_with_token_metrics, field, expected):
     """Test getting total token usage across all messages"""
-    thread = Thread(id="test-thread")
-    
-    # Add messages with metrics
-    msg1 = Message(
-        role="user",
-        content="Hello",
-        metrics={
-            "model": "gpt-4o",
-            "usage": {
-                "completion_tokens": 10,
-                "prompt_tokens": 5,
-                "total_tokens": 15
-            }
-        }
-    )
-    msg2 = Message(
-        role="assistant",
-        content="Hi there!",
-        metrics={
-            "model": "gpt-4o",
-            "usage": {
-                "completion_tokens": 20,
-                "prompt_tokens": 15,
-                "total_tokens": 35
-            }
-        }
-    )
-    
-    thread.add_message(msg1)
-    thread.add_message(msg2)
-    
-    token_usage = thread.get_total_tokens()
-    assert token_usage["overall"]["completion_tokens"] == 30
-    assert token_usage["overall"]["prompt_tokens"] == 20
-    assert token_usage["overall"]["total_tokens"] == 50
-    
-    assert "gpt-4o" in token_usage["by_model"]
-    assert token_usage["by_model"]["gpt-4o"]["completion_tokens"] == 30
-    assert token_usage["by_model"]["gpt-4o"]["prompt_tokens"] == 20
-    assert token_usage["by_model"]["gpt-4o"]["total_tokens"] == 50
+    token_usage = thread_with_token_metrics.get_total_tokens()
+    assert token_usage["overall"][field] == expected
 
-def test_get_model_usage():
-    """Test getting model usage statistics"""
-    thread = Thread(id="test-thread")
-    
-    # Add messages with different models
-    msg1 = Message(
-        role="user",
-        content="Hello",
-        metrics={
-            "model": "gpt-4o",
-            "usage": {
-                "completion_tokens": 10,
-                "prompt_tokens": 5,
-                "total_tokens": 15
-            }
-        }
-    )
-    msg2 = Message(
-        role="assistant",
-        content="Hi there!",
-        metrics={
-            "model": "gpt-3.5-turbo",
-            "usage": {
-                "completion_tokens": 20,
-                "prompt_tokens": 15,
-                "total_tokens": 35
-            }
-        }
-    )
-    
-    thread.add_message(msg1)
-    thread.add_message(msg2)
-    
-    # Test getting all model usage
-    all_usage = thread.get_model_usage()
-    assert "gpt-4o" in all_usage
-    assert "gpt-3.5-turbo" in all_usage
+@pytest.mark.parametrize("model,field,expected", [
+    ("gpt-4o", "completion_tokens", 10),
+    ("gpt-4o", "prompt_tokens", 5),
+    ("gpt-4o", "total_tokens", 15),
+    ("gpt-3.5-turbo", "completion_tokens", 20),
+    ("gpt-3.5-turbo", "prompt_tokens", 15),
+    ("gpt-3.5-turbo", "total_tokens", 35)
+])
+def test_get_total_tokens_by_model(thread_with_token_metrics, model, field, expected):
+    """Test getting token usage broken down by model"""
+    token_usage = thread_with_token_metrics.get_total_tokens()
+    assert token_usage["by_model"][model][field] == expected
+
+def test_get_model_usage(thread_with_token_metrics):
+    """Test getting model usage statistics for all models"""
+    all_usage = thread_with_token_metrics.get_model_usage()
+    assert set(all_usage) == {"gpt-4o", "gpt-3.5-turbo"}
     assert all_usage["gpt-4o"]["calls"] == 1
     assert all_usage["gpt-3.5-turbo"]["calls"] == 1
-    
-    # Test getting specific model usage
-    gpt4_usage = thread.get_model_usage("gpt-4o")
-    assert gpt4_usage["calls"] == 1
-    assert gpt4_usage["completion_tokens"] == 10
-    assert gpt4_usage["prompt_tokens"] == 5
-    assert gpt4_usage["total_tokens"] == 15
 
-def test_get_message_timing_stats():
+@pytest.mark.parametrize("model_name,expected", [
+    ("gpt-4o", {"calls": 1, "completion_tokens": 10, "prompt_tokens": 5, "total_tokens": 15}),
+    ("gpt-3.5-turbo", {"calls": 1, "completion_tokens": 20, "prompt_tokens": 15, "total_tokens": 35}),
+    ("unknown-model", {"calls": 0, "completion_tokens": 0, "prompt_tokens": 0, "total_tokens": 0})
+])
+def test_get_model_usage_for_model(thread_with_token_metrics, model_name, expected):
+    """Test getting usage statistics for a specific model"""
+    assert thread_with_token_metrics.get_model_usage(model_name) == expected
+
+@pytest.mark.parametrize("field,expected", [
+    ("total_latency", 3000.0),  # 3 seconds = 3000 milliseconds
+    ("average_latency", 1500.0),  # 1.5 seconds = 1500 milliseconds
+    ("message_count", 2)
+])
+def test_get_message_timing_stats(thread_with_timing, field, expected):
     """Test getting message timing statistics"""
+    timing_stats = thread_with_timing.get_message_timing_stats()
+    assert timing_stats[field] == expected
+
+def test_usage_stats_track_message_changes():
+    """Test usage and timing stats reflect every kind of message change"""
     thread = Thread(id="test-thread")
-    
-    # Add messages with timing metrics
-    msg1 = Message(
-        role="user",
-        content="Hello",
-        metrics={
-            "timing": {
-                "started_at": "2024-02-07T00:00:00+00:00",
-                "ended_at": "2024-02-07T00:00:01+00:00",
-                "latency": 1000.0  # 1 second = 1000 milliseconds
-            }
-        }
-    )
-    msg2 = Message(
-        role="assistant",
-        content="Hi there!",
-        metrics={
-            "timing": {
-                "started_at": "2024-02-07T00:00:02+00:00",
-                "ended_at": "2024-02-07T00:00:04+00:00",
-                "latency": 2000.0  # 2 seconds = 2000 milliseconds
-            }
-        }
-    )
-    
-    thread.add_message(msg1)
-    thread.add_message(msg2)
-    
-    timing_stats = thread.get_message_timing_stats()
-    assert timing_stats["total_latency"] == 3000.0  # 3 seconds = 3000 milliseconds
-    assert timing_stats["average_latency"] == 1500.0  # 1.5 seconds = 1500 milliseconds
-    assert timing_stats["message_count"] == 2
+    metrics = {**_GPT4O_METRICS_15, "timing": {"latency": 1000.0}}
+    thread.add_message(Message(role="assistant", content="First", metrics=metrics))
+    assert thread.get_total_tokens()["overall"]["total_tokens"] == 15
+    assert thread.get_model_usage("gpt-4o")["calls"] == 1
+    assert thread.get_message_timing_stats()["message_count"] == 1
+    
+    # Mutating a returned result must not leak into later calls
+    thread.get_total_tokens()["overall"]["total_tokens"] = 999
+    assert thread.get_total_tokens()["overall"]["total_tokens"] == 15
+    
+    thread.add_message(Message(role="assistant", content="Second", metrics=metrics))
+    assert thread.get_total_tokens()["overall"]["total_tokens"] == 30
+    assert thread.get_model_usage("gpt-4o")["calls"] == 2
+    assert thread.get_message_timing_stats()["message_count"] == 2
+    
+    # Appending directly to the list is reflected too
+    thread.messages.append(Message(role="assistant", content="Third", metrics=metrics))
+    assert thread.get_total_tokens()["overall"]["total_tokens"] == 45
+    
+    # Replacing a message by index keeps the length the same but changes the totals
+    thread.messages[0] = Message(role="assistant", content="Replaced", metrics={
+        "model": "gpt-4o-mini",
+        "usage": {"completion_tokens": 1, "prompt_tokens": 1, "total_tokens": 2},
+        "timing": {"latency": 500.0}
+    })
+    assert thread.get_total_tokens()["overall"]["total_tokens"] == 32
+    assert thread.get_model_usage("gpt-4o")["calls"] == 2
+    assert thread.get_model_usage("gpt-4o-mini")["calls"] == 1
+    assert thread.get_message_timing_stats()["total_latency"] == 2500.0
+    
+    # Editing a message's metrics in place is reflected as well
+    thread.messages[0].metrics["usage"]["total_tokens"] = 102
+    thread.messages[0].metrics["timing"]["latency"] = 1500.0
+    assert thread.get_total_tokens()["overall"]["total_tokens"] == 132
+    assert thread.get_model_usage("gpt-4o-mini")["total_tokens"] == 102
+    assert thread.get_message_timing_stats()["total_latency"] == 3500.0
+    
+    thread.clear_messages()
+    assert thread.get_total_tokens()["overall"]["total_tokens"] == 0
+    assert thread.get_model_usage() == {}
+    assert thread.get_message_timing_stats()["message_count"] == 0
 
 def test_get_message_counts():
     """Test getting message counts by role"""
     thread = Thread(id="test-thread")
     
     # Add messages with different roles
-    thread.add_message(Message(role="system", content="System message"))
-    thread.add_message(Message(role="user", content="User message 1"))
-    thread.add_message(Message(role="user", content="User message 2"))
-    thread.add_message(Message(role="assistant", content="Assistant message"))
-    thread.add_message(Message(role="tool", content="Tool message", tool_call_id="123"))
+    thread.add_messages([
+        Message(role="system", content="System message"),
+        Message(role="user", content="User message 1"),
+        Message(role="user", content="User message 2"),
+        Message(role="assistant", content="Assistant message"),
+        Message(role="tool", content="Tool message", tool_call_id="123")
+    ])
     
     counts = thread.get_message_counts()
     assert counts["system"] == 1
@@ -434,43 +593,18 @@ def test_get_message_counts():
     assert counts["assistant"] == 1
     assert counts["tool"] == 1
 
-def test_get_tool_usage():
+@pytest.mark.parametrize("tool_name,expected", [
+    ("test_tool", 2),
+    ("another_tool", 1)
+])
+def test_get_tool_usage(thread_with_tool_calls, tool_name, expected):
     """Test getting tool usage statistics"""
-    thread = Thread(id="test-thread")
-    
-    # Add messages with tool calls
-    tool_call1 = {
-        "id": "call_123",
-        "type": "function",
-        "function": {
-            "name": "test_tool",
-            "arguments": '{"arg": "value"}'
-        }
-    }
-    tool_call2 = {
-        "id": "call_456",
-        "type": "function",
-        "function": {
-            "name": "another_tool",
-            "arguments": '{"arg": "value"}'
-        }
-    }
-    
-    thread.add_message(Message(
-        role="assistant",
-        content="Using tools",
-        tool_calls=[tool_call1, tool_call2]
-    ))
-    thread.add_message(Message(
-        role="assistant",
-        content="Using tool again",
-        tool_calls=[tool_call1]
-    ))
-    
-    tool_usage = thread.get_tool_usage()
-    assert tool_usage["total_calls"] == 3
-    assert tool_usage["tools"]["test_tool"] == 2
-    assert tool_usage["tools"]["another_tool"] == 1
+    tool_usage = thread_with_tool_calls.get_tool_usage()
+    assert tool_usage["tools"][tool_name] == expected
+
+def test_get_tool_usage_total_calls(thread_with_tool_calls):
+    """Test getting the total number of tool calls"""
+    assert thread_with_tool_calls.get_tool_usage()["total_calls"] == 3
 
 def test_thread_with_multimodal_messages():
     """Test thread with multimodal messages (text and images)"""
@@ -508,12 +642,7 @@ def test_thread_with_weave_metrics():
         role="assistant",
         content="Hello",
         metrics={
-            "model": "gpt-4o",
-            "usage": {
-                "completion_tokens": 10,
-                "prompt_tokens": 5,
-                "total_tokens": 15
-            },
+            **_GPT4O_METRICS_15,
             "weave_call": {
                 "id": "call-123",
                 "ui_url": "https://weave.ui/call-123"
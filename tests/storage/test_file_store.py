@@ -1,6 +1,7 @@
 import os
+import shutil
+import uuid
 import pytest
-import tempfile
 from pathlib import Path
 from typing import AsyncGenerator
 from tyler.storage.file_store import (
@@ -19,43 +20,61 @@ def temp_storage_path(tmp_path):
     storage_path.mkdir()
     return storage_path
 
+@pytest.fixture(scope="session")
+def shared_storage_path(tmp_path_factory):
+    """Storage directory shared by configuration tests that never write files"""
+    return tmp_path_factory.mktemp("file_store_ro")
+
 @pytest.fixture
-async def temp_store() -> AsyncGenerator[FileStore, None]:
-    """Create a temporary FileStore for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        store = FileStore(base_path=temp_dir)
-        yield store
+async def temp_store(tmp_path_factory) -> AsyncGenerator[FileStore, None]:
+    """Create a temporary FileStore for testing.
+
+    The store lives on tmpfs (TEST_FS_ROOT, default /dev/shm) when that directory
+    exists, and falls back to a pytest temp directory elsewhere. The temp
+    directory is only created in the fallback case.
+    """
+    fs_root = Path(os.environ.get("TEST_FS_ROOT", "/dev/shm"))
+    if not fs_root.is_dir():
+        yield FileStore(base_path=str(tmp_path_factory.mktemp("file_store")))
+        return
+
+    base_path = fs_root / f"file_store_{uuid.uuid4().hex}"
+    base_path.mkdir(parents=True)
+    try:
+        yield FileStore(base_path=str(base_path))
+    finally:
+        shutil.rmtree(base_path, ignore_errors=True)
 
 # Configuration Tests
 
-def test_default_configuration(temp_storage_path):
+def test_default_configuration(shared_storage_path):
     """Test FileStore initializes with default configuration"""
-    store = FileStore(base_path=str(temp_storage_path))
+    store = FileStore(base_path=str(shared_storage_path))
     assert store.max_file_size == FileStore.DEFAULT_MAX_FILE_SIZE
     assert store.max_storage_size == FileStore.DEFAULT_MAX_STORAGE_SIZE
-    assert store.allowed_mime_types == FileStore.DEFAULT_ALLOWED_MIME_TYPES
+    assert store.allowed_mime_types is FileStore.DEFAULT_ALLOWED_MIME_TYPES
 
-def test_env_var_configuration(temp_storage_path, monkeypatch):
+def test_env_var_configuration(shared_storage_path, monkeypatch):
     """Test FileStore respects environment variables"""
     # Set environment variables
     monkeypatch.setenv('TYLER_MAX_FILE_SIZE', '1048576')  # 1MB
     monkeypatch.setenv('TYLER_MAX_STORAGE_SIZE', '10485760')  # 10MB
     
-    store = FileStore(base_path=str(temp_storage_path))
+    store = FileStore(base_path=str(shared_storage_path))
     assert store.max_file_size == 1048576
     assert store.max_storage_size == 10485760
 
-def test_invalid_env_vars_use_defaults(temp_storage_path, monkeypatch):
+def test_invalid_env_vars_use_defaults(shared_storage_path, monkeypatch):
     """Test FileStore handles invalid environment variables gracefully"""
     # Set invalid environment variables
     monkeypatch.setenv('TYLER_MAX_FILE_SIZE', 'invalid')
     monkeypatch.setenv('TYLER_MAX_STORAGE_SIZE', 'invalid')
     
-    store = FileStore(base_path=str(temp_storage_path))
+    store = FileStore(base_path=str(shared_storage_path))
     assert store.max_file_size == FileStore.DEFAULT_MAX_FILE_SIZE
     assert store.max_storage_size == FileStore.DEFAULT_MAX_STORAGE_SIZE
 
-def test_constructor_overrides_env_vars(temp_storage_path, monkeypatch):
+def test_constructor_overrides_env_vars(shared_storage_path, monkeypatch):
     """Test constructor parameters override environment variables"""
     # Set environment variables
     monkeypatch.setenv('TYLER_MAX_FILE_SIZE', '1048576')  # 1MB
@@ -63,7 +82,7 @@ def test_constructor_overrides_env_vars(temp_storage_path, monkeypatch):
     
     # Constructor values should override env vars
     store = FileStore(
-        base_path=str(temp_storage_path),
+        base_path=str(shared_storage_path),
         max_file_size=2097152,  # 2MB
         max_storage_size=20971520  # 20MB
     )
@@ -72,23 +91,23 @@ def test_constructor_overrides_env_vars(temp_storage_path, monkeypatch):
 
 # MIME Type Tests
 
-def test_env_var_mime_types(temp_storage_path, monkeypatch):
+def test_env_var_mime_types(shared_storage_path, monkeypatch):
     """Test FileStore respects MIME type environment variables"""
     # Set environment variable
     monkeypatch.setenv('TYLER_ALLOWED_MIME_TYPES', 'image/jpeg,image/png,application/pdf')
     
-    store = FileStore(base_path=str(temp_storage_path))
+    store = FileStore(base_path=str(shared_storage_path))
     assert store.allowed_mime_types == {'image/jpeg', 'image/png', 'application/pdf'}
 
-def test_invalid_mime_types_use_defaults(temp_storage_path, monkeypatch):
+def test_invalid_mime_types_use_defaults(shared_storage_path, monkeypatch):
     """Test FileStore handles invalid MIME types gracefully"""
     # Test with invalid format
     monkeypatch.setenv('TYLER_ALLOWED_MIME_TYPES', 'invalid,image/png,not-a-mime-type')
     
-    store = FileStore(base_path=str(temp_storage_path))
-    assert store.allowed_mime_types == FileStore.DEFAULT_ALLOWED_MIME_TYPES
+    store = FileStore(base_path=str(shared_storage_path))
+    assert store.allowed_mime_types is FileStore.DEFAULT_ALLOWED_MIME_TYPES
 
-def test_mime_types_constructor_override(temp_storage_path, monkeypatch):
+def test_mime_types_constructor_override(shared_storage_path, monkeypatch):
     """Test constructor MIME types override environment variables"""
     # Set environment variable
     monkeypatch.setenv('TYLER_ALLOWED_MIME_TYPES', 'image/jpeg,image/png')
@@ -96,7 +115,7 @@ def test_mime_types_constructor_override(temp_storage_path, monkeypatch):
     # Constructor values should override env vars
     custom_types = {'application/pdf', 'text/plain'}
     store = FileStore(
-        base_path=str(temp_storage_path),
+        base_path=str(shared_storage_path),
         allowed_mime_types=custom_types
     )
     assert store.allowed_mime_types == custom_types
@@ -110,7 +129,7 @@ async def test_save_and_get(temp_store: FileStore):
     filename = 'test.txt'
     
     # Test saving
-    result = await temp_store.save(content=content, filename=filename)
+    result = await temp_store.save(content=content, filename=filename, mime_type='text/plain')
     assert result['id'] is not None
     assert result['storage_path'] is not None
     assert result['filename'] == filename
@@ -136,7 +155,7 @@ async def test_file_not_found(temp_store: FileStore):
 async def test_delete(temp_store: FileStore):
     """Test file deletion."""
     content = b'Delete me'
-    result = await temp_store.save(content=content, filename='delete.txt')
+    result = await temp_store.save(content=content, filename='delete.txt', mime_type='text/plain')
     
     # Verify file exists
     file_path = temp_store.base_path / result['storage_path']
@@ -212,12 +231,13 @@ async def test_storage_metrics(temp_store: FileStore):
     content2 = b'File 2'
     
     # Save two files
-    await temp_store.save(content=content1, filename='file1.txt')
-    await temp_store.save(content=content2, filename='file2.txt')
+    await temp_store.save(content=content1, filename='file1.txt', mime_type='text/plain')
+    await temp_store.save(content=content2, filename='file2.txt', mime_type='text/plain')
     
     # Check metrics
-    size = await temp_store.get_storage_size()
-    count = await temp_store.get_file_count()
+    metrics = await temp_store.get_metrics()
+    size = metrics['size']
+    count = metrics['count']
     
     # Only count actual files, not directories
     expected_size = len(content1) + len(content2)
@@ -229,6 +249,10 @@ async def test_storage_metrics(temp_store: FileStore):
     expected_count = 4  # 2 files + 2 parent directories
     assert count == expected_count
 
+    # Individual accessors agree with the combined walk
+    assert await temp_store.get_storage_size() == size
+    assert await temp_store.get_file_count() == count
+
 @pytest.mark.asyncio
 async def test_batch_operations(temp_store: FileStore):
     """Test batch save and delete operations."""
@@ -30,20 +30,30 @@ def import_module_from_path(path):
     return module
 
 
-def run_example_main(module):
+def run_example_main(module, loop):
     """Run the main function of an example module."""
     if hasattr(module, "main"):
         if asyncio.iscoroutinefunction(module.main):
-            return asyncio.run(module.main())
+            return loop.run_until_complete(module.main())
         else:
             return module.main()
     return None
 
 
+@pytest.fixture(scope="module")
+def examples_loop():
+    """Event loop shared by all examples instead of one asyncio.run() loop per example."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    asyncio.set_event_loop(None)
+    loop.close()
+
+
 @pytest.mark.examples  # Mark all example tests with 'examples' marker
 @pytest.mark.integration  # Also mark as integration tests
 @pytest.mark.parametrize("example_path", example_files)
-def test_example(example_path, monkeypatch):
+def test_example(example_path, monkeypatch, examples_loop):
     """Test that an example runs without errors."""
     example_name = example_path.name
     
@@ -53,6 +63,11 @@ def test_example(example_path, monkeypatch):
     
     # Set up environment for examples
     monkeypatch.setattr("sys.argv", [str(example_path)])
+
+    # Importing an example through its file location would otherwise write
+    # examples/__pycache__; skip the .pyc write, like -p no:cacheprovider does
+    # for pytest's own cache
+    monkeypatch.setattr("sys.dont_write_bytecode", True)
     
     # Some examples might use input() - mock it to return empty string
     monkeypatch.setattr("builtins.input", lambda _: "")
@@ -64,7 +79,7 @@ def test_example(example_path, monkeypatch):
         # If the module has a main function, run it
         # Otherwise, the import itself is the test
         if hasattr(module, "main"):
-            run_example_main(module)
+            run_example_main(module, examples_loop)
         
         # If we got here, the example ran without errors
         assert True
@@ -1,9 +1,16 @@
+import asyncio
+import io
 import pytest
 import os
 import uuid
-from unittest.mock import patch, MagicMock, mock_open
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
 from tyler.tools.audio import text_to_speech, speech_to_text
-from pathlib import Path
+
+# Every test here awaits fully mocked coroutines, so they can share one event loop.
+# asyncio_mode = auto collects them; a per-test @pytest.mark.asyncio would override this.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 # Mock UUID to ensure consistent filenames in tests
 @pytest.fixture(autouse=True)
@@ -31,94 +38,94 @@ def mock_transcription_response():
         "text": "This is a transcribed text from audio."
     }
 
-@pytest.mark.asyncio
-async def test_text_to_speech_success(mock_speech_response, mock_audio_bytes):
-    """Test successful text to speech conversion"""
-    # Create mocks
-    with patch('tyler.tools.audio.speech', return_value=mock_speech_response) as mock_speech, \
-         patch('tempfile.NamedTemporaryFile') as mock_temp, \
-         patch('os.unlink') as mock_unlink, \
-         patch('builtins.open', mock_open(read_data=mock_audio_bytes)):
-        
-        # Configure the mock temp file
-        mock_temp_instance = MagicMock()
-        mock_temp_instance.name = "/tmp/test_audio.mp3"
-        mock_temp.return_value.__enter__.return_value = mock_temp_instance
-        
-        # Call the function
-        result = await text_to_speech(
-            input="Hello, this is a test.",
-            voice="alloy",
-            model="tts-1",
-            response_format="mp3",
-            speed=1.0
-        )
-        
-        # Verify the mocks were called correctly
-        mock_speech.assert_called_once_with(
-            model="tts-1",
-            voice="alloy",
-            input="Hello, this is a test.",
-            response_format="mp3",
-            speed=1.0
+@pytest.fixture
+def audio_patches(mock_audio_bytes):
+    """Patch everything the audio tools touch outside the process and yield the mocks.
+
+    Tests reconfigure return_value/side_effect on the mocks they care about.
+    """
+    # The tools only call exists() on the Path, so a plain namespace is enough
+    mock_path = SimpleNamespace(exists=lambda: True)
+    mock_temp_instance = MagicMock()
+    mock_temp_instance.name = "/tmp/test_audio.mp3"
+
+    with ExitStack() as stack:
+        mocks = SimpleNamespace(
+            speech=stack.enter_context(patch('tyler.tools.audio.speech')),
+            temp_file=stack.enter_context(patch('tempfile.NamedTemporaryFile')),
+            unlink=stack.enter_context(patch('os.unlink')),
+            # A fresh BytesIO per open(), since the tools close the handle via `with`
+            open=stack.enter_context(patch('builtins.open', side_effect=lambda *args, **kwargs: io.BytesIO(mock_audio_bytes))),
+            path=stack.enter_context(patch('tyler.tools.audio.Path', return_value=mock_path)),
+            transcription=stack.enter_context(patch('tyler.tools.audio.transcription')),
+            temp_instance=mock_temp_instance,
         )
-        mock_speech_response.stream_to_file.assert_called_once_with(mock_temp_instance.name)
-        mock_unlink.assert_called_once_with(mock_temp_instance.name)
-        
-        # Check result structure
-        assert isinstance(result, tuple)
-        assert len(result) == 2
-        
-        # Check content dict
-        content, files = result
-        assert content["success"] is True
-        assert "description" in content
-        assert "Speech generated from text: 'Hello, this is a test.'" == content["description"]
-        
-        # Check files list
-        assert isinstance(files, list)
-        assert len(files) == 1
-        file_info = files[0]
-        assert file_info["content"] == mock_audio_bytes
-        assert file_info["filename"] == "speech_test_uuid_hex.mp3"
-        assert file_info["mime_type"] == "audio/mpeg"
-        assert file_info["description"] == "Speech generated from text: 'Hello, this is a test.'"
-        
-        # Check details moved to file attributes
-        assert "attributes" in file_info
-        assert file_info["attributes"]["voice"] == "alloy"
-        assert file_info["attributes"]["model"] == "tts-1"
-        assert file_info["attributes"]["format"] == "mp3"
-        assert file_info["attributes"]["speed"] == 1.0
-        assert file_info["attributes"]["text_length"] == len("Hello, this is a test.")
-
-@pytest.mark.asyncio
-async def test_text_to_speech_invalid_voice():
-    """Test text to speech with invalid voice parameter"""
-    # No need to mock API calls for validation tests as they should fail before any API call
+        mocks.temp_file.return_value.__enter__.return_value = mock_temp_instance
+        yield mocks
+
+async def test_text_to_speech_success(audio_patches, mock_speech_response, mock_audio_bytes):
+    """Test successful text to speech conversion"""
+    audio_patches.speech.return_value = mock_speech_response
+    mock_temp_instance = audio_patches.temp_instance
+
+    # Call the function
     result = await text_to_speech(
         input="Hello, this is a test.",
-        voice="invalid_voice",  # Invalid voice
+        voice="alloy",
         model="tts-1",
         response_format="mp3",
         speed=1.0
     )
-    
-    # Check error response
+
+    # Verify the mocks were called correctly
+    audio_patches.speech.assert_called_once_with(
+        model="tts-1",
+        voice="alloy",
+        input="Hello, this is a test.",
+        response_format="mp3",
+        speed=1.0
+    )
+    mock_speech_response.stream_to_file.assert_called_once_with(mock_temp_instance.name)
+    audio_patches.unlink.assert_called_once_with(mock_temp_instance.name)
+
+    # Check result structure
+    assert isinstance(result, tuple)
+    assert len(result) == 2
+
+    # Check content dict
     content, files = result
-    assert content["success"] is False
-    assert "error" in content
-    assert "Voice invalid_voice not supported" in content["error"]
-    assert len(files) == 0
+    assert content["success"] is True
+    assert "description" in content
+    assert "Speech generated from text: 'Hello, this is a test.'" == content["description"]
+
+    # Check files list
+    assert isinstance(files, list)
+    assert len(files) == 1
+    file_info = files[0]
+    assert file_info["content"] == mock_audio_bytes
+    assert file_info["filename"] == "speech_test_uuid_hex.mp3"
+    assert file_info["mime_type"] == "audio/mpeg"
+    assert file_info["description"] == "Speech generated from text: 'Hello, this is a test.'"
 
-@pytest.mark.asyncio
-async def test_text_to_speech_invalid_model():
-    """Test text to speech with invalid model parameter"""
+    # Check details moved to file attributes
+    assert "attributes" in file_info
+    assert file_info["attributes"]["voice"] == "alloy"
+    assert file_info["attributes"]["model"] == "tts-1"
+    assert file_info["attributes"]["format"] == "mp3"
+    assert file_info["attributes"]["speed"] == 1.0
+    assert file_info["attributes"]["text_length"] == len("Hello, this is a test.")
+
+@pytest.mark.parametrize("voice, model, error_fragment", [
+    ("invalid_voice", "tts-1", "Voice invalid_voice not supported"),
+    ("alloy", "invalid-model", "Model invalid-model not supported"),
+], ids=["invalid_voice", "invalid_model"])
+async def test_text_to_speech_invalid_params(voice, model, error_fragment):
+    """Test text to speech with invalid voice or model parameters"""
     # No need to mock API calls for validation tests as they should fail before any API call
     result = await text_to_speech(
         input="Hello, this is a test.",
-        voice="alloy",
-        model="invalid-model",  # Invalid model
+        voice=voice,
+        model=model,
         response_format="mp3",
         speed=1.0
     )
@@ -127,10 +134,9 @@ async def test_text_to_speech_invalid_model():
     content, files = result
     assert content["success"] is False
     assert "error" in content
-    assert "Model invalid-model not supported" in content["error"]
+    assert error_fragment in content["error"]
     assert len(files) == 0
 
-@pytest.mark.asyncio
 async def test_text_to_speech_exception():
     """Test text to speech with an exception during processing"""
     with patch('tyler.tools.audio.speech', side_effect=Exception("Test exception")):
@@ -149,44 +155,34 @@ async def test_text_to_speech_exception():
         assert "Test exception" in content["error"]
         assert len(files) == 0
 
-@pytest.mark.asyncio
-async def test_speech_to_text_success(mock_transcription_response):
+async def test_speech_to_text_success(audio_patches, mock_transcription_response):
     """Test successful speech to text conversion"""
     file_path = "/path/to/audio.mp3"
-    
-    # Create a mock Path object that exists
-    mock_path = MagicMock(spec=Path)
-    mock_path.exists.return_value = True
-    
-    with patch('tyler.tools.audio.Path', return_value=mock_path), \
-         patch('builtins.open', mock_open()), \
-         patch('tyler.tools.audio.transcription', return_value=mock_transcription_response) as mock_transcribe:
-        
-        result = await speech_to_text(
-            file_url=file_path,
-            language="en",
-            prompt="This is a test prompt"
-        )
-        
-        # Verify the mock was called correctly
-        mock_transcribe.assert_called_once()
-        
-        # Check result
-        assert result["success"] is True
-        assert result["text"] == "This is a transcribed text from audio."
-        assert "details" in result
-        assert result["details"]["model"] == "whisper-1"
-        assert result["details"]["language"] == "en"
-        assert result["details"]["file_url"] == file_path
-
-@pytest.mark.asyncio
+    audio_patches.transcription.return_value = mock_transcription_response
+
+    result = await speech_to_text(
+        file_url=file_path,
+        language="en",
+        prompt="This is a test prompt"
+    )
+
+    # Verify the mock was called correctly
+    audio_patches.transcription.assert_called_once()
+
+    # Check result
+    assert result["success"] is True
+    assert result["text"] == "This is a transcribed text from audio."
+    assert "details" in result
+    assert result["details"]["model"] == "whisper-1"
+    assert result["details"]["language"] == "en"
+    assert result["details"]["file_url"] == file_path
+
 async def test_speech_to_text_file_not_found():
     """Test speech to text with file not found"""
     file_path = "/path/to/nonexistent.mp3"
     
-    # Create a mock Path object that doesn't exist
-    mock_path = MagicMock(spec=Path)
-    mock_path.exists.return_value = False
+    # Stand-in Path object that doesn't exist
+    mock_path = SimpleNamespace(exists=lambda: False)
     
     with patch('tyler.tools.audio.Path', return_value=mock_path):
         result = await speech_to_text(file_url=file_path)
@@ -196,22 +192,25 @@ async def test_speech_to_text_file_not_found():
         assert "error" in result
         assert "Audio file not found" in result["error"]
 
-@pytest.mark.asyncio
-async def test_speech_to_text_exception():
+async def test_speech_to_text_exception(audio_patches):
     """Test speech to text with an exception during processing"""
     file_path = "/path/to/audio.mp3"
-    
-    # Create a mock Path object that exists
-    mock_path = MagicMock(spec=Path)
-    mock_path.exists.return_value = True
-    
-    with patch('tyler.tools.audio.Path', return_value=mock_path), \
-         patch('builtins.open', mock_open()), \
-         patch('tyler.tools.audio.transcription', side_effect=Exception("Test exception")):
-        
-        result = await speech_to_text(file_url=file_path)
-        
-        # Check error response
-        assert result["success"] is False
-        assert "error" in result
-        assert "Test exception" in result["error"] 
\ No newline at end of file
+    audio_patches.transcription.side_effect = Exception("Test exception")
+
+    result = await speech_to_text(file_url=file_path)
+
+    # Check error response
+    assert result["success"] is False
+    assert "error" in result
+    assert "Test exception" in result["error"]
+
+@pytest.fixture(scope="module")
+def module_loops():
+    """Event loops seen by the loop-sharing check, kept for the whole module"""
+    return []
+
+@pytest.mark.parametrize("run", [1, 2])
+async def test_tests_share_module_event_loop(module_loops, run):
+    """Test the module-level loop_scope actually puts every test on one event loop"""
+    module_loops.append(asyncio.get_running_loop())
+    assert all(loop is module_loops[0] for loop in module_loops)
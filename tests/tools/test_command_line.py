@@ -10,71 +10,88 @@ from tyler.tools.command_line import (
     FILE_MODIFYING_COMMANDS
 )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_cwd():
-    """Fixture to mock current working directory"""
+    """Fixture to mock current working directory for the whole module"""
     with patch('os.getcwd') as mock:
         mock.return_value = '/workspace'
         yield mock
 
-def test_is_safe_path(mock_cwd):
-    """Test path safety validation"""
+@pytest.fixture(scope="module")
+def mock_subprocess_run_module():
+    """Patch subprocess.run once for the whole module"""
+    with patch('subprocess.run') as mock:
+        yield mock
+
+@pytest.fixture
+def mock_subprocess_run(mock_subprocess_run_module):
+    """Mock subprocess.run for a single test, reset before each test"""
+    mock_subprocess_run_module.reset_mock(return_value=True, side_effect=True)
+    yield mock_subprocess_run_module
+
+@pytest.mark.parametrize("path, expected", [
     # Valid paths
-    assert is_safe_path('/workspace/test.txt')
-    assert is_safe_path('test.txt')
-    assert is_safe_path('./test.txt')
-    
+    ('/workspace/test.txt', True),
+    ('test.txt', True),
+    ('./test.txt', True),
     # Invalid paths
-    assert not is_safe_path('/etc/passwd')
-    assert not is_safe_path('../outside.txt')
-    assert not is_safe_path(None)
-    assert not is_safe_path('')
-    assert not is_safe_path('   ')
-    assert not is_safe_path('/workspace/../etc/passwd')
-    assert not is_safe_path('\0malicious')
+    ('/etc/passwd', False),
+    ('../outside.txt', False),
+    (None, False),
+    ('', False),
+    ('   ', False),
+    ('/workspace/../etc/passwd', False),
+    ('\0malicious', False),
+])
+def test_is_safe_path(mock_cwd, path, expected):
+    """Test path safety validation"""
+    assert bool(is_safe_path(path)) is expected
 
-def test_is_safe_command():
-    """Test command safety validation"""
+@pytest.mark.parametrize("command, expected", [
     # Valid commands
-    assert is_safe_command('ls')
-    assert is_safe_command('ls -la')
-    assert is_safe_command('cat test.txt')
-    assert is_safe_command('grep pattern file.txt')
-    
+    ('ls', True),
+    ('ls -la', True),
+    ('cat test.txt', True),
+    ('grep pattern file.txt', True),
     # Invalid commands
-    assert not is_safe_command('rm -rf /')
-    assert not is_safe_command('ls && rm -rf /')
-    assert not is_safe_command('ls; rm -rf /')
-    assert not is_safe_command('ls | rm -rf /')
-    assert not is_safe_command('`rm -rf /`')
-    assert not is_safe_command('$(rm -rf /)')
-    assert not is_safe_command('sudo rm -rf /')
-    assert not is_safe_command('not_whitelisted_cmd')
+    ('rm -rf /', False),
+    ('ls && rm -rf /', False),
+    ('ls; rm -rf /', False),
+    ('ls | rm -rf /', False),
+    ('`rm -rf /`', False),
+    ('$(rm -rf /)', False),
+    ('sudo rm -rf /', False),
+    ('not_whitelisted_cmd', False),
+])
+def test_is_safe_command(command, expected):
+    """Test command safety validation"""
+    assert bool(is_safe_command(command)) is expected
 
-def test_validate_file_operation(mock_cwd):
-    """Test validation of file modification commands"""
+@pytest.mark.parametrize("cmd, args, expected", [
     # Valid operations
-    assert validate_file_operation('rm', ['rm', 'test.txt'])
-    assert validate_file_operation('cp', ['cp', 'source.txt', 'dest.txt'])
-    assert validate_file_operation('mv', ['mv', 'old.txt', 'new.txt'])
-    assert validate_file_operation('echo', ['echo', 'text', '>', 'file.txt'])
-    assert validate_file_operation('mkdir', ['mkdir', 'newdir'])
-    
+    ('rm', ['rm', 'test.txt'], True),
+    ('cp', ['cp', 'source.txt', 'dest.txt'], True),
+    ('mv', ['mv', 'old.txt', 'new.txt'], True),
+    ('echo', ['echo', 'text', '>', 'file.txt'], True),
+    ('mkdir', ['mkdir', 'newdir'], True),
     # Invalid operations
-    assert not validate_file_operation('rm', ['rm', '-rf', '/'])
-    assert not validate_file_operation('rm', ['rm', '-r', 'dir'])
-    assert not validate_file_operation('cp', ['cp', '/etc/passwd', 'hack.txt'])
-    assert not validate_file_operation('mv', ['mv', 'file.txt', '/etc/passwd'])
-    assert not validate_file_operation('cp', ['cp', 'file1', 'file2', 'file3'])
+    ('rm', ['rm', '-rf', '/'], False),
+    ('rm', ['rm', '-r', 'dir'], False),
+    ('cp', ['cp', '/etc/passwd', 'hack.txt'], False),
+    ('mv', ['mv', 'file.txt', '/etc/passwd'], False),
+    ('cp', ['cp', 'file1', 'file2', 'file3'], False),
+])
+def test_validate_file_operation(mock_cwd, cmd, args, expected):
+    """Test validation of file modification commands"""
+    assert bool(validate_file_operation(cmd, args)) is expected
 
-@patch('subprocess.run')
-def test_run_command_success(mock_run, mock_cwd):
+def test_run_command_success(mock_subprocess_run, mock_cwd):
     """Test successful command execution"""
     mock_process = MagicMock()
     mock_process.stdout = "command output"
     mock_process.stderr = ""
     mock_process.returncode = 0
-    mock_run.return_value = mock_process
+    mock_subprocess_run.return_value = mock_process
 
     result = run_command(command="ls -la")
     
@@ -83,7 +100,7 @@ def test_run_command_success(mock_run, mock_cwd):
     assert result["error"] is None
     assert result["exit_code"] == 0
     
-    mock_run.assert_called_once_with(
+    mock_subprocess_run.assert_called_once_with(
         "ls -la",
         shell=True,
         cwd=".",
@@ -92,14 +109,13 @@ def test_run_command_success(mock_run, mock_cwd):
         timeout=30
     )
 
-@patch('subprocess.run')
-def test_run_command_with_error(mock_run):
+def test_run_command_with_error(mock_subprocess_run):
     """Test command execution with error"""
     mock_process = MagicMock()
     mock_process.stdout = ""
     mock_process.stderr = "error message"
     mock_process.returncode = 1
-    mock_run.return_value = mock_process
+    mock_subprocess_run.return_value = mock_process
 
     result = run_command(command="cat nonexistent.txt")
     
@@ -114,10 +130,9 @@ def test_run_command_unsafe():
     assert "error" in result
     assert "Command not allowed" in result["error"]
 
-@patch('subprocess.run')
-def test_run_command_timeout(mock_run):
+def test_run_command_timeout(mock_subprocess_run):
     """Test command timeout handling"""
-    mock_run.side_effect = subprocess.TimeoutExpired(cmd="sleep 100", timeout=30)
+    mock_subprocess_run.side_effect = subprocess.TimeoutExpired(cmd="sleep 100", timeout=30)
     
     result = run_command(command="sleep 100")
     assert "error" in result
@@ -131,18 +146,17 @@ def test_safe_commands_consistency():
     # All commands should have descriptions
     assert all(isinstance(desc, str) and desc for desc in SAFE_COMMANDS.values())
 
-@patch('subprocess.run')
-def test_run_command_working_dir(mock_run):
+def test_run_command_working_dir(mock_subprocess_run):
     """Test command execution with custom working directory"""
     mock_process = MagicMock()
     mock_process.stdout = "command output"
     mock_process.stderr = ""
     mock_process.returncode = 0
-    mock_run.return_value = mock_process
+    mock_subprocess_run.return_value = mock_process
 
     result = run_command(command="ls", working_dir="/workspace/subdir")
     
-    mock_run.assert_called_once_with(
+    mock_subprocess_run.assert_called_once_with(
         "ls",
         shell=True,
         cwd="/workspace/subdir",
@@ -1,18 +1,26 @@
 import pytest
+import asyncio
 import os
 import json
 import pandas as pd
 import io
 import base64
+import mimetypes
 from pathlib import Path
 from unittest.mock import patch, AsyncMock, MagicMock, mock_open
-from tyler.tools.files import Files
+import tyler.tools.files as files_mod
+from tyler.tools.files import Files, _guess_mime_type, _guess_mime_type_for_suffix
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def files_instance():
-    """Return a Files instance for testing"""
+    """Return a Files instance shared by the module; Files keeps no per-call state"""
     return Files()
 
+@pytest.fixture(autouse=True)
+def clear_mime_type_cache():
+    """Start every test with an empty MIME type cache so patches of mimetypes.guess_type apply"""
+    _guess_mime_type_for_suffix.cache_clear()
+
 @pytest.fixture
 def sample_text_content():
     """Sample text content for testing"""
@@ -73,7 +81,7 @@ async def test_read_file_nonexistent(files_instance):
 async def test_read_file_text(files_instance, sample_text_content):
     """Test reading a text file"""
     with patch('pathlib.Path.exists', return_value=True), \
-         patch('pathlib.Path.read_bytes', return_value=sample_text_content), \
+         patch('tyler.tools.files._read_bytes', return_value=sample_text_content), \
          patch('magic.from_buffer', return_value='text/plain'):
         
         result, files = await files_instance.read_file("sample.txt")
@@ -85,11 +93,37 @@ async def test_read_file_text(files_instance, sample_text_content):
         assert files[0]["filename"] == "sample.txt"
         assert files[0]["mime_type"] == "text/plain"
 
+@pytest.mark.asyncio
+async def test_read_file_from_disk(files_instance, sample_text_content, tmp_path):
+    """Test reading a real file from disk"""
+    file_path = tmp_path / "sample.txt"
+    file_path.write_bytes(sample_text_content)
+
+    result, files = await files_instance.read_file(str(file_path), mime_type="text/plain")
+
+    assert result["success"] is True
+    assert result["text"] == sample_text_content.decode('utf-8')
+    assert base64.b64decode(files[0]["content"]) == sample_text_content
+
+@pytest.mark.asyncio
+async def test_read_files(files_instance, tmp_path):
+    """Test reading several files concurrently keeps results in input order"""
+    paths = []
+    for i in range(3):
+        file_path = tmp_path / f"sample{i}.txt"
+        file_path.write_text(f"content {i}")
+        paths.append(str(file_path))
+
+    results = await files_instance.read_files(paths + [str(tmp_path / "missing.txt")])
+
+    assert [result["text"] for result, _ in results[:3]] == ["content 0", "content 1", "content 2"]
+    assert results[3][0]["success"] is False
+
 @pytest.mark.asyncio
 async def test_read_file_json(files_instance, sample_json_content):
     """Test reading a JSON file"""
     with patch('pathlib.Path.exists', return_value=True), \
-         patch('pathlib.Path.read_bytes', return_value=sample_json_content), \
+         patch('tyler.tools.files._read_bytes', return_value=sample_json_content), \
          patch('magic.from_buffer', return_value='application/json'):
         
         result, files = await files_instance.read_file("sample.json")
@@ -106,7 +140,7 @@ async def test_read_file_json(files_instance, sample_json_content):
 async def test_read_file_json_with_path(files_instance, sample_json_content):
     """Test reading a JSON file with path extraction"""
     with patch('pathlib.Path.exists', return_value=True), \
-         patch('pathlib.Path.read_bytes', return_value=sample_json_content), \
+         patch('tyler.tools.files._read_bytes', return_value=sample_json_content), \
          patch('magic.from_buffer', return_value='application/json'):
         
         # Test with direct path
@@ -128,7 +162,7 @@ async def test_read_file_json_with_path(files_instance, sample_json_content):
 async def test_read_file_csv(files_instance, sample_csv_content):
     """Test reading a CSV file"""
     with patch('pathlib.Path.exists', return_value=True), \
-         patch('pathlib.Path.read_bytes', return_value=sample_csv_content), \
+         patch('tyler.tools.files._read_bytes', return_value=sample_csv_content), \
          patch('magic.from_buffer', return_value='text/csv'):
         
         result, files = await files_instance.read_file("sample.csv")
@@ -143,6 +177,25 @@ async def test_read_file_csv(files_instance, sample_csv_content):
         assert files[0]["filename"] == "sample.csv"
         assert files[0]["mime_type"] == "text/csv"
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("csv_content", [
+    pytest.param(None, id="sample"),
+    pytest.param(b"day,amount\n2024-01-01,1.5\n2024-01-02,2\n2024-01-03,3\n", id="dates"),
+])
+async def test_parse_csv_chunked(files_instance, sample_csv_content, csv_content):
+    """Test large CSVs are parsed in chunks with the same statistics and preview"""
+    content = csv_content or sample_csv_content
+    expected, _ = await files_instance.parse_csv(content, "sample.csv")
+
+    with patch.object(Files, 'LARGE_CSV_THRESHOLD_BYTES', 0), \
+         patch.object(Files, 'CSV_CHUNK_ROWS', 2):
+        result, files = await files_instance.parse_csv(content, "sample.csv")
+
+    assert result["success"] is True
+    assert result["statistics"] == expected["statistics"]
+    assert result["preview"] == expected["preview"]
+    assert len(files) == 1
+
 @pytest.mark.asyncio
 async def test_read_file_pdf(files_instance, sample_pdf_content, mock_pdf_reader):
     """Test reading a PDF file"""
@@ -168,7 +221,7 @@ async def test_read_file_pdf(files_instance, sample_pdf_content, mock_pdf_reader
     
     with patch.object(files_instance, 'process_pdf', return_value=(mock_result, mock_files)):
         with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.read_bytes', return_value=valid_pdf_content), \
+             patch('tyler.tools.files._read_bytes', return_value=valid_pdf_content), \
              patch('magic.from_buffer', return_value='application/pdf'):
             
             result, files = await files_instance.read_file("sample.pdf")
@@ -188,7 +241,7 @@ async def test_read_file_pdf_error(files_instance, sample_pdf_content):
     """Test reading a PDF file with errors"""
     # Use the invalid PDF content to trigger an error
     with patch('pathlib.Path.exists', return_value=True), \
-         patch('pathlib.Path.read_bytes', return_value=sample_pdf_content), \
+         patch('tyler.tools.files._read_bytes', return_value=sample_pdf_content), \
          patch('magic.from_buffer', return_value='application/pdf'), \
          patch.object(files_instance, 'process_pdf', side_effect=Exception("Stream has ended unexpectedly")):
         
@@ -245,6 +298,18 @@ async def test_process_text_encoding_fallback(files_instance):
     assert result["encoding"] in ["latin-1", "cp1252", "iso-8859-1"]
     assert len(files) == 1
 
+@pytest.mark.asyncio
+async def test_process_text_utf8_bom(files_instance):
+    """Test a UTF-8 byte order mark is detected and stripped from the text"""
+    content = b'\xef\xbb\xbfCaf\xc3\xa9 menu'
+    
+    result, files = await files_instance.process_text(content, "sample.txt")
+    
+    assert result["success"] is True
+    assert result["encoding"] == "utf-8-sig"
+    assert result["text"] == "Caf\u00e9 menu"
+    assert base64.b64decode(files[0]["content"]) == content
+
 @pytest.mark.asyncio
 async def test_process_text_all_encodings_fail(files_instance):
     """Test text processing when all encodings fail"""
@@ -376,6 +441,25 @@ async def test_write_file_mime_type_inference(files_instance):
         assert result["success"] is True
         assert result["mime_type"] == "text/plain"
 
+def test_guess_mime_type_cached_per_suffix():
+    """Test MIME type guesses are cached by suffix rather than full path"""
+    with patch('mimetypes.guess_type', wraps=mimetypes.guess_type) as mock_guess:
+        assert _guess_mime_type("a/report.csv") == "text/csv"
+        assert _guess_mime_type("b/OTHER.CSV") == "text/csv"
+    
+    assert mock_guess.call_count == 1
+
+@pytest.mark.parametrize("file_url", [
+    "report.v2.json",
+    "data.2024.csv",
+    "archive.tar.gz",
+    "notes.txt",
+    "no_extension",
+])
+def test_guess_mime_type_matches_mimetypes(file_url):
+    """Test dotted and compound names get the same type as mimetypes.guess_type"""
+    assert _guess_mime_type(file_url) == mimetypes.guess_type(file_url)[0]
+
 @pytest.mark.asyncio
 async def test_write_file_error_handling(files_instance):
     """Test error handling when writing files"""
@@ -400,6 +484,31 @@ async def test_write_file_error_handling(files_instance):
     assert result["success"] is False
     assert "error" in result
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content", [
+    pytest.param(b'{"value": 123456789012345678901234567890}', id="big_int"),
+    pytest.param(b'{"value": NaN, "other": Infinity}', id="non_finite"),
+])
+async def test_parse_json_matches_stdlib(files_instance, content):
+    """Test JSON that orjson rejects still parses the way json.loads does"""
+    result, _ = await files_instance.parse_json(content, "data.json")
+
+    assert result["success"] is True
+    assert json.dumps(result["data"]) == json.dumps(json.loads(content))
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content", [
+    pytest.param({"value": 123456789012345678901234567890}, id="big_int"),
+    pytest.param({"value": float("nan"), "other": None}, id="nan"),
+    pytest.param({"value": float("inf")}, id="infinity"),
+])
+async def test_write_file_json_matches_stdlib(files_instance, content):
+    """Test JSON that orjson cannot write is written the way json.dumps does"""
+    result, files = await files_instance.write_file(content, "output.json")
+
+    assert result["success"] is True
+    assert base64.b64decode(files[0]["content"]) == json.dumps(content, indent=2, ensure_ascii=False).encode('utf-8')
+
 @pytest.mark.asyncio
 async def test_json_decode_error(files_instance):
     """Test handling of JSON decode errors"""
@@ -429,7 +538,7 @@ async def test_unknown_mime_type(files_instance):
     content = b"Some binary content"
     
     with patch('pathlib.Path.exists', return_value=True), \
-         patch('pathlib.Path.read_bytes', return_value=content), \
+         patch('tyler.tools.files._read_bytes', return_value=content), \
          patch('magic.from_buffer', return_value='application/octet-stream'):
         
         result, files = await files_instance.read_file("unknown.bin")
@@ -439,6 +548,35 @@ async def test_unknown_mime_type(files_instance):
         assert len(files) == 1
         assert files[0]["mime_type"] == "application/octet-stream"
 
+@pytest.mark.asyncio
+async def test_read_file_signature_skips_libmagic(files_instance):
+    """Test files with a known extension and matching signature skip libmagic"""
+    content = b"\x89PNG\r\n\x1a\nfake image data"
+    
+    with patch('pathlib.Path.exists', return_value=True), \
+         patch('tyler.tools.files._read_bytes', return_value=content), \
+         patch('magic.from_buffer') as mock_from_buffer:
+        
+        result, files = await files_instance.read_file("image.PNG")
+        
+        mock_from_buffer.assert_not_called()
+        assert result["mime_type"] == "image/png"
+        assert files[0]["mime_type"] == "image/png"
+
+@pytest.mark.asyncio
+async def test_read_file_signature_mismatch_uses_libmagic(files_instance):
+    """Test a known extension without the matching signature still goes through libmagic"""
+    content = b"not really a png"
+    
+    with patch('pathlib.Path.exists', return_value=True), \
+         patch('tyler.tools.files._read_bytes', return_value=content), \
+         patch('magic.from_buffer', return_value='text/plain') as mock_from_buffer:
+        
+        result, files = await files_instance.read_file("image.png")
+        
+        mock_from_buffer.assert_called_once_with(content, mime=True)
+        assert result["text"] == "not really a png"
+
 @pytest.mark.asyncio
 async def test_process_pdf_directly(files_instance, mock_pdf_reader):
     """Test the process_pdf method directly"""
@@ -474,6 +612,21 @@ async def test_process_pdf_directly(files_instance, mock_pdf_reader):
         assert files[0]["filename"] == "sample.pdf"
         assert files[0]["mime_type"] == "application/pdf"
 
+@pytest.mark.asyncio
+async def test_process_pdf_extracts_text_in_thread(files_instance, sample_pdf_content, mock_pdf_reader):
+    """Test process_pdf runs the real text extraction off the event loop"""
+    with patch('tyler.tools.files.PdfReader', return_value=mock_pdf_reader), \
+         patch('tyler.tools.files.asyncio.to_thread', wraps=asyncio.to_thread) as mock_to_thread:
+        result, files = await files_instance.process_pdf(sample_pdf_content, "sample.pdf")
+
+    mock_to_thread.assert_called_once()
+    assert result["success"] is True
+    assert result["text"] == "Page 1 content\nPage 2 content"
+    assert result["pages"] == 2
+    assert result["empty_pages"] == []
+    assert result["processing_method"] == "text"
+    assert files[0]["content"] == base64.b64encode(sample_pdf_content).decode('utf-8')
+
 @pytest.mark.asyncio
 async def test_process_pdf_with_vision_directly(files_instance):
     """Test the _process_pdf_with_vision method directly"""
@@ -504,4 +657,24 @@ async def test_process_pdf_with_vision_directly(files_instance):
         assert result["type"] == "pdf"
         assert result["processing_method"] == "vision"
         assert "Extracted text from image" in result["text"]
-        assert len(files) == 1 
\ No newline at end of file
+        assert len(files) == 1 
+
+def test_start_libmagic_warmup_runs_once(monkeypatch):
+    """Test the libmagic warmup thread is only started on request, once per process"""
+    monkeypatch.delenv('TYLER_NO_WARMUP', raising=False)
+    monkeypatch.setattr(files_mod, '_libmagic_warmup_started', False)
+    with patch('tyler.tools.files.threading.Thread') as mock_thread:
+        files_mod.start_libmagic_warmup()
+        files_mod.start_libmagic_warmup()
+    
+    mock_thread.assert_called_once_with(target=files_mod._warm_libmagic, name="tyler-libmagic-warmup", daemon=True)
+    mock_thread.return_value.start.assert_called_once_with()
+
+def test_start_libmagic_warmup_disabled(monkeypatch):
+    """Test TYLER_NO_WARMUP disables the libmagic warmup"""
+    monkeypatch.setenv('TYLER_NO_WARMUP', '1')
+    monkeypatch.setattr(files_mod, '_libmagic_warmup_started', False)
+    with patch('tyler.tools.files.threading.Thread') as mock_thread:
+        files_mod.start_libmagic_warmup()
+    
+    mock_thread.assert_not_called()
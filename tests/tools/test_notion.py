@@ -1,215 +1,217 @@
-import os
+import json
 import pytest
 import requests
-from unittest.mock import patch, MagicMock
+import requests_mock
+from types import MappingProxyType
 from tyler.tools.notion import (
     NotionClient, search, get_page, get_page_content,
     create_comment, get_comments, create_page, update_block,
-    create_notion_client
+    create_notion_client, REQUEST_TIMEOUT
 )
 
-# Mock responses
-MOCK_SEARCH_RESPONSE = {
+# Mock responses. These are read-only test vectors, frozen so no test can mutate
+# them for the tests that follow.
+MOCK_SEARCH_RESPONSE = MappingProxyType({
     "results": [{"id": "123", "title": "Test Page"}]
-}
+})
 
-MOCK_PAGE_RESPONSE = {
+MOCK_PAGE_RESPONSE = MappingProxyType({
     "id": "123",
     "properties": {"title": "Test Page"}
-}
+})
 
-MOCK_PAGE_CONTENT_RESPONSE = {
+MOCK_PAGE_CONTENT_RESPONSE = MappingProxyType({
     "results": [{"type": "paragraph", "paragraph": {"text": "Test content"}}],
     "next_cursor": None
-}
+})
 
-MOCK_COMMENT_RESPONSE = {
+MOCK_COMMENT_RESPONSE = MappingProxyType({
     "id": "comment-123",
     "rich_text": {"text": {"content": "Test comment"}}
-}
+})
 
-MOCK_COMMENTS_LIST_RESPONSE = {
+MOCK_COMMENTS_LIST_RESPONSE = MappingProxyType({
     "results": [MOCK_COMMENT_RESPONSE],
     "next_cursor": None
-}
+})
 
-MOCK_CREATE_PAGE_RESPONSE = {
+MOCK_CREATE_PAGE_RESPONSE = MappingProxyType({
     "id": "page-123",
     "properties": {"title": "New Test Page"}
-}
+})
 
-MOCK_UPDATE_BLOCK_RESPONSE = {
+MOCK_UPDATE_BLOCK_RESPONSE = MappingProxyType({
     "id": "block-123",
     "type": "paragraph",
     "paragraph": {"text": [{"text": {"content": "Updated content"}}]}
-}
+})
+
+NOTION_API = "https://api.notion.com/v1"
+
+# (method, path, payload) routes registered once for the whole module
+NOTION_ROUTES = [
+    ("POST", "/search", MOCK_SEARCH_RESPONSE),
+    ("GET", "/pages/123", MOCK_PAGE_RESPONSE),
+    ("GET", "/blocks/123/children", MOCK_PAGE_CONTENT_RESPONSE),
+    ("POST", "/comments", MOCK_COMMENT_RESPONSE),
+    ("GET", "/comments", MOCK_COMMENTS_LIST_RESPONSE),
+    ("POST", "/pages", MOCK_CREATE_PAGE_RESPONSE),
+    ("PATCH", "/blocks/block1", MOCK_UPDATE_BLOCK_RESPONSE),
+]
+
+@pytest.fixture(scope="module")
+def notion_mocker():
+    """Answer the Notion API routes from the mock responses, registered once for the module"""
+    with requests_mock.Mocker() as mocker:
+        for method, path, payload in NOTION_ROUTES:
+            mocker.register_uri(
+                method, f"{NOTION_API}{path}",
+                text=json.dumps(payload, default=dict),
+                headers={"Content-Type": "application/json"}
+            )
+        yield mocker
 
 @pytest.fixture
-def mock_env_token():
-    """Mock environment token fixture"""
-    with patch.dict(os.environ, {"NOTION_TOKEN": "test-token"}):
-        yield
+def notion_api(notion_mocker):
+    """Per-test view of the module's mocker with cleared request history"""
+    notion_mocker.reset_mock()
+    return notion_mocker
 
-def test_notion_client_init_missing_token():
+def test_notion_client_init_missing_token(monkeypatch):
     """Test NotionClient initialization with missing token"""
-    with patch.dict(os.environ, clear=True):
-        with pytest.raises(ValueError, match="Notion API token not found"):
-            create_notion_client()
+    monkeypatch.delenv("NOTION_TOKEN")
+    with pytest.raises(ValueError, match="Notion API token not found"):
+        create_notion_client()
 
-def test_search(mock_env_token):
+def test_search(notion_api):
     """Test search functionality"""
-    with patch('requests.post') as mock_post:
-        mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_SEARCH_RESPONSE
-        mock_post.return_value = mock_response
-
-        result = search(
-            query="test query",
-            filter={"property": "object", "value": "page"},
-            start_cursor="cursor1",
-            page_size=10
-        )
-        assert result == MOCK_SEARCH_RESPONSE
-        mock_post.assert_called_once()
-
-def test_get_page(mock_env_token):
+
+    result = search(
+        query="test query",
+        filter={"property": "object", "value": "page"},
+        start_cursor="cursor1",
+        page_size=10
+    )
+    assert result == MOCK_SEARCH_RESPONSE
+    assert notion_api.last_request.method == "POST"
+    assert notion_api.last_request.path == "/v1/search"
+    assert notion_api.last_request.json() == {
+        "query": "test query",
+        "filter": {"property": "object", "value": "page"},
+        "start_cursor": "cursor1",
+        "page_size": 10
+    }
+
+def test_get_page(notion_api):
     """Test get_page functionality"""
-    with patch('requests.get') as mock_get:
-        mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_PAGE_RESPONSE
-        mock_get.return_value = mock_response
 
-        result = get_page(page_id="123")
-        assert result == MOCK_PAGE_RESPONSE
-        mock_get.assert_called_once()
+    result = get_page(page_id="123")
+    assert result == MOCK_PAGE_RESPONSE
+    assert notion_api.last_request.method == "GET"
+    assert notion_api.last_request.path == "/v1/pages/123"
 
-def test_get_page_content(mock_env_token):
+def test_get_page_content(notion_api):
     """Test get_page_content functionality"""
-    with patch('requests.get') as mock_get:
-        mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_PAGE_CONTENT_RESPONSE
-        mock_get.return_value = mock_response
-
-        result = get_page_content(page_id="123")
-        assert "results" in result
-        mock_get.assert_called_once()
-
-def test_create_comment(mock_env_token):
-    """Test create_comment functionality"""
-    with patch('requests.post') as mock_post:
-        mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_COMMENT_RESPONSE
-        mock_post.return_value = mock_response
-
-        rich_text = [{"text": {"content": "Test comment"}}]
-        result = create_comment(rich_text=rich_text, page_id="123")
-        assert result == MOCK_COMMENT_RESPONSE
-        mock_post.assert_called_once()
-
-def test_get_comments(mock_env_token):
-    """Test get_comments function with all parameters"""
-    with patch('requests.get') as mock_get:
-        mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_COMMENTS_LIST_RESPONSE
-        mock_get.return_value = mock_response
-
-        result = get_comments(block_id="block1", start_cursor="cursor1", page_size=10)
-        assert result == MOCK_COMMENTS_LIST_RESPONSE
-        mock_get.assert_called_once()
-
-def test_create_page(mock_env_token):
+
+    result = get_page_content(page_id="123")
+    assert "results" in result
+    assert notion_api.call_count == 1
+    assert notion_api.last_request.path == "/v1/blocks/123/children"
+
+@pytest.mark.parametrize("kwargs,expected_body", [
+    pytest.param({"page_id": "123"}, {"parent": {"page_id": "123"}}, id="page_id"),
+    pytest.param({"page_id": "page1"}, {"parent": {"page_id": "page1"}}, id="other_page_id"),
+    pytest.param({"discussion_id": "discussion1"}, {"discussion_id": "discussion1"}, id="discussion_id"),
+])
+def test_create_comment(notion_api, kwargs, expected_body):
+    """Test create_comment with a page_id or a discussion_id"""
+
+    rich_text = [{"text": {"content": "Test comment"}}]
+    result = create_comment(rich_text=rich_text, **kwargs)
+    assert result == MOCK_COMMENT_RESPONSE
+    assert notion_api.last_request.method == "POST"
+    assert notion_api.last_request.json() == {"rich_text": rich_text, **expected_body}
+
+@pytest.mark.parametrize("kwargs,expected_query", [
+    pytest.param({"block_id": "block1"}, "block_id=block1", id="minimal"),
+    pytest.param(
+        {"block_id": "block1", "start_cursor": "cursor1", "page_size": 10},
+        "block_id=block1&start_cursor=cursor1&page_size=10",
+        id="all_params"
+    ),
+])
+def test_get_comments(notion_api, kwargs, expected_query):
+    """Test get_comments with required and optional parameters"""
+
+    result = get_comments(**kwargs)
+    assert result == MOCK_COMMENTS_LIST_RESPONSE
+    assert notion_api.last_request.method == "GET"
+    assert notion_api.last_request.url.endswith(f"/v1/comments?{expected_query}")
+
+def test_create_page(notion_api):
     """Test create_page function"""
-    with patch('requests.post') as mock_post:
-        mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_CREATE_PAGE_RESPONSE
-        mock_post.return_value = mock_response
-
-        parent = {"type": "page_id", "id": "parent1"}
-        properties = {"title": {"title": [{"text": {"content": "New Test Page"}}]}}
-        children = [{"type": "paragraph", "paragraph": {"text": [{"text": {"content": "Test content"}}]}}]
-        icon = {"type": "emoji", "emoji": "📝"}
-        cover = {"type": "external", "external": {"url": "https://example.com/image.jpg"}}
-
-        result = create_page(
-            parent=parent,
-            properties=properties,
-            children=children,
-            icon=icon,
-            cover=cover
-        )
-        assert result == MOCK_CREATE_PAGE_RESPONSE
-        mock_post.assert_called_once()
-
-def test_update_block(mock_env_token):
+
+    parent = {"type": "page_id", "id": "parent1"}
+    properties = {"title": {"title": [{"text": {"content": "New Test Page"}}]}}
+    children = [{"type": "paragraph", "paragraph": {"text": [{"text": {"content": "Test content"}}]}}]
+    icon = {"type": "emoji", "emoji": "📝"}
+    cover = {"type": "external", "external": {"url": "https://example.com/image.jpg"}}
+
+    result = create_page(
+        parent=parent,
+        properties=properties,
+        children=children,
+        icon=icon,
+        cover=cover
+    )
+    assert result == MOCK_CREATE_PAGE_RESPONSE
+    assert notion_api.last_request.path == "/v1/pages"
+    assert notion_api.last_request.json() == {
+        "parent": parent,
+        "properties": properties,
+        "children": children,
+        "icon": icon,
+        "cover": cover
+    }
+
+def test_update_block(notion_api):
     """Test update_block function"""
-    with patch('requests.patch') as mock_patch:
-        mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_UPDATE_BLOCK_RESPONSE
-        mock_patch.return_value = mock_response
-
-        block_type = "paragraph"
-        content = {
-            "rich_text": [{"text": {"content": "Updated content"}}]
-        }
-
-        result = update_block(
-            block_id="block1",
-            block_type=block_type,
-            content=content
-        )
-        assert result == MOCK_UPDATE_BLOCK_RESPONSE
-        mock_patch.assert_called_once()
-
-def test_notion_api_error_handling(mock_env_token):
+
+    block_type = "paragraph"
+    content = {
+        "rich_text": [{"text": {"content": "Updated content"}}]
+    }
+
+    result = update_block(
+        block_id="block1",
+        block_type=block_type,
+        content=content
+    )
+    assert result == MOCK_UPDATE_BLOCK_RESPONSE
+    assert notion_api.last_request.method == "PATCH"
+    assert notion_api.last_request.path == "/v1/blocks/block1"
+    assert notion_api.last_request.json() == {block_type: content}
+
+def test_notion_api_error_handling(notion_api):
     """Test error handling for API requests"""
-    with patch('requests.post') as mock_post:
-        mock_post.side_effect = requests.exceptions.RequestException("API Error")
+    with requests_mock.Mocker() as mocker:
+        mocker.post(f"{NOTION_API}/search", exc=requests.exceptions.RequestException("API Error"))
         
         with pytest.raises(Exception, match="API Error"):
             search(query="test")
 
-def test_search_with_minimal_params(mock_env_token):
+def test_search_with_minimal_params(notion_api):
     """Test search function with minimal parameters"""
-    with patch('requests.post') as mock_post:
-        mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_SEARCH_RESPONSE
-        mock_post.return_value = mock_response
-
-        result = search()
-        assert result == MOCK_SEARCH_RESPONSE
-        mock_post.assert_called_once()
-
-def test_create_comment_with_page_id(mock_env_token):
-    """Test create_comment function with page_id"""
-    with patch('requests.post') as mock_post:
-        mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_COMMENT_RESPONSE
-        mock_post.return_value = mock_response
-
-        rich_text = [{"text": {"content": "Test comment"}}]
-        result = create_comment(rich_text=rich_text, page_id="page1")
-        assert result == MOCK_COMMENT_RESPONSE
-        mock_post.assert_called_once()
-
-def test_create_comment_with_discussion_id(mock_env_token):
-    """Test create_comment function with discussion_id"""
-    with patch('requests.post') as mock_post:
-        mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_COMMENT_RESPONSE
-        mock_post.return_value = mock_response
-
-        rich_text = [{"text": {"content": "Test comment"}}]
-        result = create_comment(rich_text=rich_text, discussion_id="discussion1")
-        assert result == MOCK_COMMENT_RESPONSE
-        mock_post.assert_called_once()
-
-def test_get_comments_minimal_params(mock_env_token):
-    """Test get_comments function with only required parameters"""
-    with patch('requests.get') as mock_get:
-        mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_COMMENTS_LIST_RESPONSE
-        mock_get.return_value = mock_response
-
-        result = get_comments(block_id="block1")
-        assert result == MOCK_COMMENTS_LIST_RESPONSE
-        mock_get.assert_called_once() 
\ No newline at end of file
+
+    result = search()
+    assert result == MOCK_SEARCH_RESPONSE
+    assert notion_api.last_request.json() == {}
+
+def test_requests_use_timeout(notion_api):
+    """Test every Notion API request is sent with the default timeout"""
+    search(query="test")
+    assert notion_api.last_request.timeout == REQUEST_TIMEOUT
+
+def test_clients_share_session(notion_api):
+    """Test separate clients reuse the module's pooled session"""
+    assert create_notion_client().session is create_notion_client().session
@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import patch, MagicMock
+from tests.helpers import _resp
 from tyler.tools.slack import (
     SlackClient,
     post_to_slack,
@@ -22,6 +23,16 @@ def mock_slack_client():
         mock_instance.chat_postEphemeral.return_value = {"ok": True}
         yield mock_instance
 
+@pytest.fixture
+def mock_slack_instance():
+    """Fixture to patch SlackClient in the slack tools and yield the instance it returns"""
+    with patch('tyler.tools.slack.SlackClient') as mock_slack_class:
+        mock_instance = MagicMock()
+        mock_instance.client.chat_postMessage.return_value = {"ok": True}
+        mock_instance.client.chat_postEphemeral.return_value = {"ok": True}
+        mock_slack_class.return_value = mock_instance
+        yield mock_instance
+
 def test_slack_client_init_missing_token(monkeypatch):
     """Test SlackClient initialization with missing token"""
     monkeypatch.delenv("SLACK_BOT_TOKEN", raising=False)
@@ -33,19 +44,14 @@ def test_slack_client_init(mock_env_token):
     client = SlackClient()
     assert client.token == "mock-token"
 
-@patch('tyler.tools.slack.SlackClient')
-def test_post_to_slack(mock_slack_client):
+def test_post_to_slack(mock_slack_instance):
     """Test posting messages to Slack"""
-    mock_instance = MagicMock()
-    mock_instance.client.chat_postMessage.return_value = {"ok": True}
-    mock_slack_client.return_value = mock_instance
-
     blocks = [{"type": "section", "text": {"type": "mrkdwn", "text": "Test message"}}]
 
     # Test with channel name without #
     result = post_to_slack(channel="general", blocks=blocks)
     assert result is True
-    mock_instance.client.chat_postMessage.assert_called_with(
+    mock_slack_instance.client.chat_postMessage.assert_called_with(
         channel="#general",
         blocks=blocks,
         text="Test message"
@@ -54,7 +60,7 @@ def test_post_to_slack(mock_slack_client):
     # Test with channel name with #
     result = post_to_slack(channel="#random", blocks=blocks)
     assert result is True
-    mock_instance.client.chat_postMessage.assert_called_with(
+    mock_slack_instance.client.chat_postMessage.assert_called_with(
         channel="#random",
         blocks=blocks,
         text="Test message"
@@ -63,7 +69,7 @@ def test_post_to_slack(mock_slack_client):
     # Test with channel ID
     result = post_to_slack(channel="C1234567890", blocks=blocks)
     assert result is True
-    mock_instance.client.chat_postMessage.assert_called_with(
+    mock_slack_instance.client.chat_postMessage.assert_called_with(
         channel="C1234567890",
         blocks=blocks,
         text="Test message"
@@ -72,14 +78,7 @@ def test_post_to_slack(mock_slack_client):
 @patch('litellm.completion')
 def test_generate_slack_blocks(mock_completion):
     """Test generating Slack blocks from content"""
-    mock_response = MagicMock()
-    mock_response.choices = [
-        MagicMock(
-            message=MagicMock(
-                content='[{"type": "section", "text": {"type": "mrkdwn", "text": "Test content"}}]'
-            )
-        )
-    ]
+    mock_response = _resp('[{"type": "section", "text": {"type": "mrkdwn", "text": "Test content"}}]')
     mock_completion.return_value = mock_response
 
     result = generate_slack_blocks(content="Test content")
@@ -93,13 +92,8 @@ def test_generate_slack_blocks(mock_completion):
     assert isinstance(result, list)
     assert "Error" in result[0]["text"]["text"]
 
-@patch('tyler.tools.slack.SlackClient')
-def test_send_ephemeral_message(mock_slack_client):
+def test_send_ephemeral_message(mock_slack_instance):
     """Test sending ephemeral messages"""
-    mock_instance = MagicMock()
-    mock_instance.client.chat_postEphemeral.return_value = {"ok": True}
-    mock_slack_client.return_value = mock_instance
-
     result = send_ephemeral_message(
         channel="general",
         user="U123",
@@ -107,19 +101,14 @@ def test_send_ephemeral_message(mock_slack_client):
     )
     
     assert result is True
-    mock_instance.client.chat_postEphemeral.assert_called_with(
+    mock_slack_instance.client.chat_postEphemeral.assert_called_with(
         channel="general",
         user="U123",
         text="Test message"
     )
 
-@patch('tyler.tools.slack.SlackClient')
-def test_reply_in_thread(mock_slack_client):
+def test_reply_in_thread(mock_slack_instance):
     """Test replying in threads"""
-    mock_instance = MagicMock()
-    mock_instance.client.chat_postMessage.return_value = {"ok": True}
-    mock_slack_client.return_value = mock_instance
-
     result = reply_in_thread(
         channel="general",
         thread_ts="1234567890.123",
@@ -128,7 +117,7 @@ def test_reply_in_thread(mock_slack_client):
     )
     
     assert result is True
-    mock_instance.client.chat_postMessage.assert_called_with(
+    mock_slack_instance.client.chat_postMessage.assert_called_with(
         channel="general",
         thread_ts="1234567890.123",
         text="Test reply",
@@ -1,5 +1,8 @@
 import pytest
-from unittest.mock import patch, MagicMock
+import requests
+import requests_mock
+from unittest.mock import patch
+import base64
 from pathlib import Path
 from tyler.tools.web import fetch_page, download_file, extract_text_from_html, fetch_html
 
@@ -29,19 +32,23 @@ Test paragraph
 
 Test div content"""
 
+MOCK_HEADERS = {
+    'content-type': 'text/html',
+    'content-length': str(len(MOCK_HTML_CONTENT))
+}
+
+@pytest.fixture(scope="module")
+def web_mocker():
+    """Serve MOCK_HTML_CONTENT for any GET, registered once for the module"""
+    with requests_mock.Mocker() as mocker:
+        mocker.get(requests_mock.ANY, text=MOCK_HTML_CONTENT, headers=MOCK_HEADERS)
+        yield mocker
+
 @pytest.fixture(autouse=True)
-def mock_requests():
-    """Mock all requests to prevent any real API calls"""
-    with patch('requests.get') as mock_get, patch('requests.head') as mock_head:
-        mock_response = MagicMock()
-        mock_response.text = MOCK_HTML_CONTENT
-        mock_response.headers = {
-            'content-type': 'text/html',
-            'content-length': '1000'
-        }
-        mock_get.return_value = mock_response
-        mock_head.return_value = mock_response
-        yield mock_get, mock_head
+def mock_requests(web_mocker):
+    """Mock all requests to prevent any real API calls, clearing history before each test"""
+    web_mocker.reset_mock()
+    yield web_mocker
 
 @pytest.fixture
 def mock_downloads_dir(tmp_path):
@@ -56,26 +63,20 @@ def test_fetch_html_success():
     html = fetch_html("https://example.com")
     assert html == MOCK_HTML_CONTENT
 
-def test_fetch_html_with_headers():
+def test_fetch_html_with_headers(mock_requests):
     """Test HTML fetching with custom headers"""
     headers = {"User-Agent": "Test Bot"}
-    with patch('requests.get') as mock_get:
-        mock_response = MagicMock()
-        mock_response.text = MOCK_HTML_CONTENT
-        mock_get.return_value = mock_response
-        
-        fetch_html("https://example.com", headers)
-        
-        mock_get.assert_called_with(
-            "https://example.com",
-            headers=headers,
-            timeout=30
-        )
+    fetch_html("https://example.com", headers)
+    
+    assert mock_requests.call_count == 1
+    assert mock_requests.last_request.url == "https://example.com/"
+    assert mock_requests.last_request.headers["User-Agent"] == "Test Bot"
+    assert mock_requests.last_request.timeout == 30
 
 def test_fetch_html_error():
     """Test error handling in fetch_html"""
-    with patch('requests.get') as mock_get:
-        mock_get.side_effect = Exception("Connection error")
+    with requests_mock.Mocker() as mocker:
+        mocker.get("https://example.com", exc=requests.exceptions.ConnectionError("Connection error"))
         with pytest.raises(Exception, match="Error fetching URL: Connection error"):
             fetch_html("https://example.com")
 
@@ -104,8 +105,8 @@ def test_fetch_page_html_format():
 
 def test_fetch_page_error():
     """Test fetch_page error handling"""
-    with patch('requests.get') as mock_get:
-        mock_get.side_effect = Exception("Test error")
+    with requests_mock.Mocker() as mocker:
+        mocker.get("https://example.com", exc=requests.exceptions.ConnectionError("Test error"))
         result = fetch_page(url="https://example.com")
         assert result["success"] is False
         assert result["status_code"] is None
@@ -119,7 +120,8 @@ def test_download_file_success(mock_downloads_dir):
     
     assert result["success"] is True
     assert result["content_type"] == "text/html"
-    assert result["file_size"] == 1000
+    assert result["file_size"] == len(MOCK_HTML_CONTENT)
+    assert base64.b64decode(files[0]["content"]) == MOCK_HTML_CONTENT.encode()
     assert result["filename"] == "file.txt"
     assert len(files) == 1
     assert files[0]["filename"] == "file.txt"
@@ -129,15 +131,12 @@ def test_download_file_success(mock_downloads_dir):
 
 def test_download_file_with_content_disposition(mock_downloads_dir):
     """Test file download with Content-Disposition header"""
-    with patch('requests.get') as mock_get:
-        mock_response = MagicMock()
-        mock_response.headers = {
+    with requests_mock.Mocker() as mocker:
+        mocker.get("https://example.com/file", content=b'test content', headers={
             'Content-Disposition': 'attachment; filename="server_file.txt"',
             'content-type': 'text/plain',
-            'content-length': '1000'
-        }
-        mock_response.iter_content.return_value = [b'test content']
-        mock_get.return_value = mock_response
+            'content-length': '12'
+        })
         
         result, files = download_file(url="https://example.com/file")
         
@@ -147,8 +146,8 @@ def test_download_file_with_content_disposition(mock_downloads_dir):
 
 def test_download_file_error():
     """Test download_file error handling"""
-    with patch('requests.get') as mock_get:
-        mock_get.side_effect = Exception("Download failed")
+    with requests_mock.Mocker() as mocker:
+        mocker.get("https://example.com/file.txt", exc=requests.exceptions.ConnectionError("Download failed"))
         result, files = download_file(url="https://example.com/file.txt")
         
         assert result["success"] is False
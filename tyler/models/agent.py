@@ -135,6 +135,9 @@ class Agent(Model):
                 loaded_tools = tool_runner.load_tool_module(tool)
                 if loaded_tools:
                     self._processed_tools.extend(loaded_tools)
+                if tool == "files":
+                    from tyler.tools.files import start_libmagic_warmup
+                    start_libmagic_warmup()
             elif isinstance(tool, dict):
                 # Add custom tool
                 if 'definition' not in tool or 'implementation' not in tool:
@@ -60,7 +60,7 @@ class Message(BaseModel):
         }
     )
 
-    @field_validator("timestamp", mode="before")
+    @field_validator("timestamp", mode="after")
     def ensure_timezone(cls, value: datetime) -> datetime:
         """Ensure timestamp is timezone-aware UTC"""
         if value.tzinfo is None:
@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional, Literal, Any
+from typing import List, Dict, Optional, Literal, Any, Iterable
 from datetime import datetime, UTC
 from pydantic import BaseModel, Field, field_validator
 from tyler.models.message import Message
@@ -36,7 +36,7 @@ class Thread(BaseModel):
         }
     }
     
-    @field_validator("created_at", "updated_at", mode="before")
+    @field_validator("created_at", "updated_at", mode="after")
     def ensure_timezone(cls, value: datetime) -> datetime:
         """Ensure all datetime fields are timezone-aware UTC"""
         if value.tzinfo is None:
@@ -55,6 +55,17 @@ class Thread(BaseModel):
             "source": self.source
         }
     
+    def to_wire(self) -> bytes:
+        """Encode the thread as compact JSON bytes using msgspec (optional dependency)"""
+        from tyler.models.wire import thread_to_wire
+        return thread_to_wire(self)
+
+    @classmethod
+    def from_wire(cls, data: bytes) -> "Thread":
+        """Decode a thread from bytes produced by to_wire()"""
+        from tyler.models.wire import thread_from_wire
+        return thread_from_wire(data)
+    
     def ensure_system_prompt(self, prompt: str) -> None:
         """Ensures a system prompt exists as the first message in the thread.
         
@@ -66,17 +77,29 @@ class Thread(BaseModel):
 
     def add_message(self, message: Message) -> None:
         """Add a new message to the thread and update analytics"""
-        # Set message sequence - system messages always get 0, others get next available number starting at 1
-        if message.role == "system":
-            message.sequence = 0
-            # Insert at beginning to maintain system message first
-            self.messages.insert(0, message)
-        else:
-            # Find highest sequence number and increment
-            max_sequence = max((m.sequence for m in self.messages if m.role != "system"), default=0)
-            message.sequence = max_sequence + 1
-            self.messages.append(message)
+        self.add_messages([message])
+
+    def add_messages(self, messages: Iterable[Message]) -> None:
+        """Add several messages to the thread in order
+        
+        Equivalent to calling add_message for each message, but finds the
+        highest sequence number once and updates updated_at once.
+        """
+        # Find highest sequence number once and increment per message
+        max_sequence = max((m.sequence for m in self.messages if m.role != "system"), default=0)
+        for message in messages:
+            # Set message sequence - system messages always get 0, others get next available number starting at 1
+            if message.role == "system":
+                message.sequence = 0
+                # Insert at beginning to maintain system message first
+                self.messages.insert(0, message)
+            else:
+                max_sequence += 1
+                message.sequence = max_sequence
+                self.messages.append(message)
         
+        # The list was modified in place, so record the field as set for exclude_unset dumps
+        self.model_fields_set.add("messages")
         self.updated_at = datetime.now(UTC)
 
     def get_messages_for_chat_completion(self) -> List[Dict[str, Any]]:
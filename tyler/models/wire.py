@@ -0,0 +1,120 @@
+"""
+Compact JSON wire format for threads, backed by msgspec.
+
+msgspec is optional. Install the ``wire`` extra to use Thread.to_wire() and Thread.from_wire().
+"""
+from typing import Dict, Optional, Any, Union, List, Literal
+from datetime import datetime, UTC
+
+try:
+    import msgspec
+
+    class AttachmentWire(msgspec.Struct):
+        """Wire representation of an Attachment. Bytes content is carried as base64 text."""
+        filename: str
+        content: Optional[str] = None
+        mime_type: Optional[str] = None
+        attributes: Optional[Dict[str, Any]] = None
+        file_id: Optional[str] = None
+        storage_path: Optional[str] = None
+        storage_backend: Optional[str] = None
+        status: Literal["pending", "stored", "failed"] = "pending"
+
+    class FunctionWire(msgspec.Struct):
+        """Wire representation of the function called by a tool call"""
+        name: str
+        arguments: str
+
+    class ToolCallWire(msgspec.Struct):
+        """Wire representation of a tool call"""
+        id: str
+        type: Literal["function"]
+        function: FunctionWire
+
+    class MessageWire(msgspec.Struct):
+        """Wire representation of a Message"""
+        id: str
+        role: Literal["system", "user", "assistant", "tool"]
+        timestamp: datetime
+        sequence: Optional[int] = None
+        content: Union[str, List[Dict[str, Any]], None] = None
+        name: Optional[str] = None
+        tool_call_id: Optional[str] = None
+        tool_calls: Optional[List[ToolCallWire]] = None
+        attributes: Dict[str, Any] = {}
+        source: Optional[Dict[str, Any]] = None
+        attachments: List[AttachmentWire] = []
+        # Left unset when absent so the Message default metrics structure applies
+        metrics: Union[Dict[str, Any], msgspec.UnsetType] = msgspec.UNSET
+
+    class ThreadWire(msgspec.Struct):
+        """Wire representation of a Thread"""
+        id: str
+        created_at: datetime
+        updated_at: datetime
+        title: Optional[str] = None
+        messages: List[MessageWire] = []
+        attributes: Dict[str, Any] = {}
+        source: Optional[Dict[str, Any]] = None
+
+    _encoder = msgspec.json.Encoder()
+    _decoder = msgspec.json.Decoder(ThreadWire)
+
+except ImportError:
+    msgspec = None
+
+
+def _require_msgspec() -> None:
+    if msgspec is None:
+        raise ImportError("msgspec is required for the thread wire format. Install it with: pip install tyler-agent[wire]")
+
+
+def _ensure_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC, matching the model validators"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def thread_to_wire(thread) -> bytes:
+    """Encode a Thread as JSON bytes"""
+    _require_msgspec()
+    # msgspec encodes datetimes as ISO 8601 and bytes as base64 natively
+    return _encoder.encode(thread.model_dump())
+
+
+def thread_from_wire(data: bytes):
+    """Decode JSON bytes produced by thread_to_wire back into a Thread
+
+    The structure and types are checked by msgspec while decoding, so the models
+    are built with model_construct rather than validated a second time. What the
+    structs cannot express is done here, as the model validators would: tool
+    messages must carry a tool_call_id and naive datetimes are taken as UTC.
+    """
+    _require_msgspec()
+    from tyler.models.thread import Thread
+    from tyler.models.message import Message
+    from tyler.models.attachment import Attachment
+
+    wire = _decoder.decode(data)
+    messages = []
+    for index, message_wire in enumerate(wire.messages):
+        if message_wire.role == "tool" and not message_wire.tool_call_id:
+            raise msgspec.ValidationError(
+                f"tool_call_id is required for tool messages - at `$.messages[{index}]`"
+            )
+        message_data = msgspec.structs.asdict(message_wire)
+        message_data["timestamp"] = _ensure_utc(message_wire.timestamp)
+        if message_wire.tool_calls is not None:
+            message_data["tool_calls"] = msgspec.to_builtins(message_wire.tool_calls)
+        if message_data["metrics"] is msgspec.UNSET:
+            del message_data["metrics"]
+        message_data["attachments"] = [
+            Attachment.model_construct(**msgspec.structs.asdict(a)) for a in message_wire.attachments
+        ]
+        messages.append(Message.model_construct(**message_data))
+    thread_data = msgspec.structs.asdict(wire)
+    thread_data["messages"] = messages
+    thread_data["created_at"] = _ensure_utc(wire.created_at)
+    thread_data["updated_at"] = _ensure_utc(wire.updated_at)
+    return Thread.model_construct(**thread_data)
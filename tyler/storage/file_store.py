@@ -43,7 +43,8 @@ class FileStore:
     # Default configuration
     DEFAULT_MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
     DEFAULT_MAX_STORAGE_SIZE = 5 * 1024 * 1024 * 1024  # 5GB
-    DEFAULT_ALLOWED_MIME_TYPES = {
+    # Frozen so every store using the defaults can share this one set
+    DEFAULT_ALLOWED_MIME_TYPES = frozenset({
         # Documents
         'application/pdf',
         'application/msword',
@@ -72,7 +73,7 @@ class FileStore:
         'audio/aac',
         'audio/flac',
         'audio/x-m4a',
-    }
+    })
     
     def __init__(self, base_path: Optional[str] = None, max_file_size: Optional[int] = None, 
                  allowed_mime_types: Optional[Set[str]] = None, max_storage_size: Optional[int] = None):
@@ -318,27 +319,32 @@ class FileStore:
             # Directory not empty, ignore
             pass
 
-    async def get_storage_size(self) -> int:
-        """Get total storage size in bytes"""
+    async def get_metrics(self) -> Dict[str, int]:
+        """Get total storage size in bytes and number of entries in one directory walk"""
         total = 0
+        count = 0
         for path in self.base_path.rglob('*'):
+            count += 1
             if path.is_file():
                 total += path.stat().st_size
-        return total
+        return {'size': total, 'count': count}
+
+    async def get_storage_size(self) -> int:
+        """Get total storage size in bytes"""
+        return (await self.get_metrics())['size']
 
     async def get_file_count(self) -> int:
         """Get total number of files"""
-        return len(list(self.base_path.rglob('*')))
+        return (await self.get_metrics())['count']
 
     async def check_health(self) -> Dict[str, Any]:
         """Check storage health and return metrics"""
         try:
-            total_size = await self.get_storage_size()
-            file_count = await self.get_file_count()
+            metrics = await self.get_metrics()
             return {
                 'healthy': True,
-                'total_size': total_size,
-                'file_count': file_count,
+                'total_size': metrics['size'],
+                'file_count': metrics['count'],
                 'errors': []
             }
         except Exception as e:
@@ -1,27 +1,170 @@
 """Unified file operations module combining file reading and document processing capabilities"""
 
 import os
+import asyncio
+import functools
+import threading
 import weave
 from typing import Dict, Any, Optional, List, Tuple, Union
 from pathlib import Path
 import mimetypes
-import base64
 import io
 import magic
 import pandas as pd
 import json
+import math
+import re
 from pypdf import PdfReader
 from pdf2image import convert_from_bytes
 from litellm import completion
 from tyler.utils.logging import get_logger
 
+try:
+    import pybase64 as base64  # SIMD-accelerated drop-in for the stdlib module
+    # Encodes straight into a str, skipping the intermediate bytes object
+    _b64encode_str = base64.b64encode_as_string
+except ImportError:
+    import base64
+
+    def _b64encode_str(data: bytes) -> str:
+        return base64.b64encode(data).decode('ascii')
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+
 # Get configured logger
 logger = get_logger(__name__)
 
+# Extensions whose MIME type can be confirmed from a fixed file signature,
+# letting read_file skip the libmagic rule walk for the most common binaries
+_SIGNATURE_MIME_TYPES = {
+    '.pdf': (b'%PDF-', 'application/pdf'),
+    '.png': (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    '.jpg': (b'\xff\xd8\xff', 'image/jpeg'),
+    '.jpeg': (b'\xff\xd8\xff', 'image/jpeg'),
+    '.gif': (b'GIF8', 'image/gif'),
+}
+
+def _detect_mime_type(file_path: Path, content: bytes) -> str:
+    """Detect a MIME type from the extension and file signature, falling back to libmagic"""
+    signature = _SIGNATURE_MIME_TYPES.get(file_path.suffix.lower())
+    if signature is not None and content.startswith(signature[0]):
+        return signature[1]
+    return magic.from_buffer(content, mime=True)
+
+def _read_bytes(path: Path) -> bytes:
+    """Read a whole file in one unbuffered read, skipping BufferedReader setup"""
+    with open(path, 'rb', buffering=0) as f:
+        return f.readall()
+
+@functools.lru_cache(maxsize=256)
+def _guess_mime_type_for_suffix(suffix: str) -> Optional[str]:
+    """Guess a MIME type from a single lower-cased suffix like '.csv', cached per suffix"""
+    return mimetypes.guess_type(f"file{suffix}")[0]
+
+def _guess_mime_type(file_url: str) -> Optional[str]:
+    """Guess a MIME type from a file name
+
+    The last suffix is looked up through the per-suffix cache. Names it cannot
+    resolve, such as 'archive.tar.gz', are guessed from the full name.
+    """
+    return (
+        _guess_mime_type_for_suffix(Path(file_url).suffix.lower())
+        or mimetypes.guess_type(file_url)[0]
+    )
+
+def _extract_pdf_text(content: bytes) -> Tuple[str, int, List[int]]:
+    """Extract text from a PDF, returning (text, page count, 1-based empty pages)"""
+    pdf_reader = PdfReader(io.BytesIO(content))
+    pages_text = []
+    empty_pages = []
+    
+    for i, page in enumerate(pdf_reader.pages):
+        try:
+            page_text = page.extract_text()
+            if not page_text.strip():
+                empty_pages.append(i + 1)
+            pages_text.append(page_text)
+        except Exception:
+            empty_pages.append(i + 1)
+            continue
+            
+    return "\n".join(pages_text).strip(), len(pdf_reader.pages), empty_pages
+
+# Integers outside the 64-bit range orjson supports have at least 20 digits
+_LONG_DIGIT_RUN = re.compile(rb'\d{20,}')
+
+def _json_loads(content: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed
+
+    orjson is stricter than the stdlib: it rejects NaN/Infinity literals, lone
+    surrogates and non-UTF-8 input, and reads integers wider than 64 bits as
+    floats. Anything it rejects, and any document with a run of 20 or more digits,
+    is handed to json.loads so results match the stdlib.
+    """
+    if orjson is not None and not _LONG_DIGIT_RUN.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+def _has_non_finite_float(content: Any) -> bool:
+    """Check whether nested lists/dicts contain a NaN or infinite float"""
+    stack = [content]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+def _json_dumps(content: Any) -> bytes:
+    """Serialize content to indented UTF-8 JSON bytes, using orjson when it is installed
+
+    orjson cannot serialize integers wider than 64 bits or lone surrogates, and
+    writes NaN/Infinity as null. Those cases go through json.dumps so the output
+    matches the stdlib.
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            # A non-finite float can only have been written as null
+            if b"null" not in data or not _has_non_finite_float(content):
+                return data
+    return json.dumps(content, indent=2, ensure_ascii=False).encode('utf-8')
+
+@functools.lru_cache(maxsize=1024)
+def _compile_json_path(path: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """Split a dotted JSON path like 'items[1].name' into (key, index) steps"""
+    steps = []
+    for part in path.split('.'):
+        if '[' in part:
+            name, index = part.split('[')
+            steps.append((name, int(index.rstrip(']'))))
+        else:
+            steps.append((part, None))
+    return tuple(steps)
+
 class Files:
     """Unified file operations system that handles both basic file operations
     and specialized document processing"""
 
+    # CSVs larger than this are parsed in chunks of CSV_CHUNK_ROWS rows so the
+    # whole DataFrame is never materialized at once
+    LARGE_CSV_THRESHOLD_BYTES = 50 * 1024 * 1024
+    CSV_CHUNK_ROWS = 100_000
+
     @weave.op(name="read-file")
     async def read_file(self, file_url: str, mime_type: Optional[str] = None) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         """Smart file reading with automatic format detection and processing
@@ -44,11 +187,11 @@ class Files:
                     []
                 )
             
-            content = file_path.read_bytes()
+            content = await asyncio.to_thread(_read_bytes, file_path)
 
             # Detect MIME type if not provided
             if not mime_type:
-                mime_type = magic.from_buffer(content, mime=True)
+                mime_type = _detect_mime_type(file_path, content)
 
             # Route to appropriate handler based on MIME type
             if mime_type == 'application/pdf':
@@ -68,7 +211,7 @@ class Files:
                         "file_url": file_url
                     },
                     [{
-                        "content": base64.b64encode(content).decode('utf-8'),
+                        "content": _b64encode_str(content),
                         "filename": file_path.name,
                         "mime_type": mime_type
                     }]
@@ -81,24 +224,22 @@ class Files:
                 []
             )
 
+    async def read_files(self, file_urls: List[str]) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Read several files concurrently
+        
+        Args:
+            file_urls: Paths to the files to read
+            
+        Returns:
+            List of read_file results, in the same order as file_urls
+        """
+        return list(await asyncio.gather(*(self.read_file(file_url) for file_url in file_urls)))
+
     async def process_pdf(self, content: bytes, file_url: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         """Process PDF with smart fallback to Vision API"""
         try:
-            pdf_reader = PdfReader(io.BytesIO(content))
-            text = ""
-            empty_pages = []
-            
-            for i, page in enumerate(pdf_reader.pages):
-                try:
-                    page_text = page.extract_text()
-                    if not page_text.strip():
-                        empty_pages.append(i + 1)
-                    text += page_text + "\n"
-                except Exception:
-                    empty_pages.append(i + 1)
-                    continue
-                    
-            text = text.strip()
+            # pypdf extraction is CPU-bound; keep it off the event loop
+            text, page_count, empty_pages = await asyncio.to_thread(_extract_pdf_text, content)
             
             # If no text extracted, try Vision API
             if not text:
@@ -109,13 +250,13 @@ class Files:
                     "success": True,
                     "text": text,
                     "type": "pdf",
-                    "pages": len(pdf_reader.pages),
+                    "pages": page_count,
                     "empty_pages": empty_pages,
                     "processing_method": "text",
                     "file_url": file_url
                 },
                 [{
-                    "content": base64.b64encode(content).decode('utf-8'),
+                    "content": _b64encode_str(content),
                     "filename": Path(file_url).name,
                     "mime_type": "application/pdf"
                 }]
@@ -143,7 +284,7 @@ class Files:
                 img_byte_arr = img_byte_arr.getvalue()
                 
                 # Convert to base64
-                b64_image = base64.b64encode(img_byte_arr).decode('utf-8')
+                b64_image = _b64encode_str(img_byte_arr)
                 
                 # Process with Vision API
                 response = completion(
@@ -185,7 +326,7 @@ class Files:
                     "file_url": file_url
                 },
                 [{
-                    "content": base64.b64encode("\n\n".join(pages_text).encode('utf-8')).decode('utf-8'),
+                    "content": _b64encode_str("\n\n".join(pages_text).encode('utf-8')),
                     "filename": Path(file_url).name,
                     "mime_type": "application/pdf"
                 }]
@@ -201,18 +342,17 @@ class Files:
     async def parse_csv(self, content: bytes, file_url: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         """Parse CSV with statistics and preview"""
         try:
-            # Use StringIO to create file-like object from bytes
-            csv_data = io.StringIO(content.decode('utf-8'))
-            df = pd.read_csv(csv_data)
-            
-            stats = {
-                "total_rows": len(df),
-                "total_columns": len(df.columns),
-                "columns": list(df.columns),
-                "column_types": {col: str(df[col].dtype) for col in df.columns}
-            }
-
-            preview = df.head(5).to_dict(orient='records')
+            if len(content) > self.LARGE_CSV_THRESHOLD_BYTES:
+                stats, preview = self._csv_stats_chunked(content)
+            else:
+                df = pd.read_csv(io.BytesIO(content))
+                stats = {
+                    "total_rows": len(df),
+                    "total_columns": len(df.columns),
+                    "columns": list(df.columns),
+                    "column_types": {col: str(df[col].dtype) for col in df.columns}
+                }
+                preview = df.head(5).to_dict(orient='records')
 
             return (
                 {
@@ -222,7 +362,7 @@ class Files:
                     "file_url": file_url
                 },
                 [{
-                    "content": base64.b64encode(content).decode('utf-8'),
+                    "content": _b64encode_str(content),
                     "filename": Path(file_url).name,
                     "mime_type": "text/csv"
                 }]
@@ -235,22 +375,43 @@ class Files:
                 []
             )
 
+    def _csv_stats_chunked(self, content: bytes) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Compute CSV statistics and a 5-row preview one chunk at a time
+        
+        Column types are taken from the first chunk. Both paths use pandas' default
+        C parser so types and error handling don't depend on file size.
+        """
+        total_rows = 0
+        columns: List[str] = []
+        column_types: Dict[str, str] = {}
+        preview: List[Dict[str, Any]] = []
+        for chunk in pd.read_csv(io.BytesIO(content), chunksize=self.CSV_CHUNK_ROWS):
+            if not columns:
+                columns = list(chunk.columns)
+                column_types = {col: str(chunk[col].dtype) for col in chunk.columns}
+            if len(preview) < 5:
+                preview.extend(chunk.head(5 - len(preview)).to_dict(orient='records'))
+            total_rows += len(chunk)
+        stats = {
+            "total_rows": total_rows,
+            "total_columns": len(columns),
+            "columns": columns,
+            "column_types": column_types
+        }
+        return stats, preview
+
     async def parse_json(self, content: bytes, file_url: str, path: Optional[str] = None) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         """Parse JSON with optional path extraction"""
         try:
-            data = json.loads(content)
+            data = _json_loads(content)
 
             if path:
                 try:
-                    parts = path.split('.')
                     current = data
-                    for part in parts:
-                        if '[' in part:
-                            name, index = part.split('[')
-                            index = int(index.rstrip(']'))
-                            current = current[name][index]
-                        else:
-                            current = current[part]
+                    for name, index in _compile_json_path(path):
+                        current = current[name]
+                        if index is not None:
+                            current = current[index]
                     data = current
                 except (KeyError, IndexError) as e:
                     return (
@@ -269,7 +430,7 @@ class Files:
                     "file_url": file_url
                 },
                 [{
-                    "content": base64.b64encode(content).decode('utf-8'),
+                    "content": _b64encode_str(content),
                     "filename": Path(file_url).name,
                     "mime_type": "application/json"
                 }]
@@ -294,8 +455,13 @@ class Files:
     async def process_text(self, content: bytes, file_url: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         """Process plain text files"""
         try:
+            # A UTF-8 BOM settles the encoding up front and shouldn't leak into the text
+            encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+            if content[:3] == b'\xef\xbb\xbf':
+                encodings.insert(0, 'utf-8-sig')
+
             # Try different encodings
-            for encoding in ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']:
+            for encoding in encodings:
                 try:
                     text = content.decode(encoding)
                     return (
@@ -306,7 +472,7 @@ class Files:
                             "file_url": file_url
                         },
                         [{
-                            "content": base64.b64encode(content).decode('utf-8'),
+                            "content": _b64encode_str(content),
                             "filename": Path(file_url).name,
                             "mime_type": "text/plain"
                         }]
@@ -348,7 +514,7 @@ class Files:
         try:
             # Detect MIME type if not provided
             if not mime_type:
-                mime_type = mimetypes.guess_type(file_url)[0]
+                mime_type = _guess_mime_type(file_url)
                 if not mime_type:
                     # Try to infer from content type
                     if isinstance(content, (dict, list)):
@@ -380,7 +546,7 @@ class Files:
                     "size": len(processed_content)
                 },
                 [{
-                    "content": base64.b64encode(processed_content).decode('utf-8'),
+                    "content": _b64encode_str(processed_content),
                     "filename": Path(file_url).name,
                     "mime_type": mime_type
                 }]
@@ -401,8 +567,7 @@ class Files:
         """Convert content to JSON and return as bytes"""
         try:
             # Ensure content is JSON serializable
-            json_str = json.dumps(content, indent=2, ensure_ascii=False)
-            return json_str.encode('utf-8')
+            return _json_dumps(content)
         except Exception as e:
             raise ValueError(f"Failed to serialize content to JSON: {str(e)}")
 
@@ -411,17 +576,16 @@ class Files:
         try:
             # Handle different input types
             if isinstance(content, pd.DataFrame):
-                csv_buffer = io.StringIO()
-                content.to_csv(csv_buffer, index=False)
-                return csv_buffer.getvalue().encode('utf-8')
+                df = content
             elif isinstance(content, (list, dict)):
                 # Convert to DataFrame first
                 df = pd.DataFrame(content)
-                csv_buffer = io.StringIO()
-                df.to_csv(csv_buffer, index=False)
-                return csv_buffer.getvalue().encode('utf-8')
             else:
                 raise ValueError(f"Unsupported content type for CSV: {type(content)}")
+            # Write encoded bytes directly rather than building an intermediate str
+            csv_buffer = io.BytesIO()
+            df.to_csv(csv_buffer, index=False, encoding='utf-8')
+            return csv_buffer.getvalue()
         except Exception as e:
             raise ValueError(f"Failed to convert content to CSV: {str(e)}")
 
@@ -495,4 +659,27 @@ TOOLS = [
         },
         "implementation": Files().write_file
     }
-] 
\ No newline at end of file
+] 
+
+_libmagic_warmup_started = False
+_libmagic_warmup_lock = threading.Lock()
+
+def _warm_libmagic() -> None:
+    """Load the libmagic database into python-magic's cached instance"""
+    try:
+        magic.from_buffer(b"warmup", mime=True)
+    except Exception as e:
+        logger.debug(f"libmagic warmup failed: {str(e)}")
+
+def start_libmagic_warmup() -> None:
+    """Load the libmagic database in a background thread so the first read_file
+    call doesn't pay for it. Runs at most once per process; set TYLER_NO_WARMUP
+    to disable."""
+    global _libmagic_warmup_started
+    if os.getenv('TYLER_NO_WARMUP'):
+        return
+    with _libmagic_warmup_lock:
+        if _libmagic_warmup_started:
+            return
+        _libmagic_warmup_started = True
+    threading.Thread(target=_warm_libmagic, name="tyler-libmagic-warmup", daemon=True).start()
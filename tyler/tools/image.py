@@ -1,11 +1,17 @@
 import os
 import weave
-import base64
 from typing import Dict, List, Optional, Any, Tuple
 from litellm import image_generation, completion
 import httpx
 from pathlib import Path
 
+try:
+    import pybase64 as base64  # SIMD-accelerated drop-in for the stdlib module
+except ImportError:
+    import base64
+
+IMAGE_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 @weave.op(name="image-generate")
 async def generate_image(*, 
     prompt: str,
@@ -72,18 +78,20 @@ async def generate_image(*,
                 []
             )
 
-        # Fetch the image bytes
+        # Stream the image bytes into a single buffer
+        image_bytes = bytearray()
         async with httpx.AsyncClient() as client:
-            img_response = await client.get(image_url)
-            await img_response.raise_for_status()
-            image_bytes = img_response.content
+            async with client.stream("GET", image_url) as img_response:
+                img_response.raise_for_status()
+                async for chunk in img_response.aiter_bytes(IMAGE_DOWNLOAD_CHUNK_SIZE):
+                    image_bytes.extend(chunk)
 
         # Create a unique filename based on timestamp
         filename = f"generated_image_{response['created']}.png"
         description = response["data"][0].get("revised_prompt", prompt)
 
         # Base64 encode the image bytes
-        base64_image = base64.b64encode(image_bytes).decode('utf-8')
+        base64_image = base64.b64encode(image_bytes).decode('ascii')
 
         # Return tuple with content dict and files list
         return (
@@ -139,11 +147,10 @@ async def analyze_image(*,
             raise FileNotFoundError(f"Image file not found at {file_path}")
             
         # Read the image content
-        with open(file_path, "rb") as f:
-            image_content = f.read()
+        image_content = file_path.read_bytes()
             
         # Convert to base64 for vision API
-        image_base64 = base64.b64encode(image_content).decode('utf-8')
+        image_base64 = base64.b64encode(image_content).decode('ascii')
         
         # Create vision API request
         messages = [
@@ -1,4 +1,5 @@
 import os
+import atexit
 import requests
 import weave
 from typing import Dict, List, Optional
@@ -14,6 +15,17 @@ class SearchParams:
     def to_dict(self) -> Dict:
         return {k: v for k, v in self.__dict__.items() if v is not None}
 
+# Shared across clients so repeated tool calls reuse pooled connections to the API.
+# Tool calls may run in threads. The session is only used to send requests: auth
+# and version headers are passed per request and session state is never changed,
+# which leaves urllib3's thread-safe connection pool as the only shared state.
+# It is closed at interpreter exit.
+_session = requests.Session()
+atexit.register(_session.close)
+
+# Seconds to wait for the Notion API to connect or respond
+REQUEST_TIMEOUT = 30
+
 def create_notion_client():
     """Create a new NotionClient instance"""
     token = os.getenv("NOTION_TOKEN")
@@ -22,9 +34,10 @@ def create_notion_client():
     return NotionClient(token)
 
 class NotionClient:
-    def __init__(self, token: str):
+    def __init__(self, token: str, session: Optional[requests.Session] = None):
         """Initialize the Notion client"""
         self.token = token
+        self.session = session or _session
         self.base_url = "https://api.notion.com/v1"
         self.headers = {
             "Authorization": f"Bearer {token}",
@@ -38,11 +51,11 @@ class NotionClient:
 
         try:
             if method == "GET":
-                response = requests.get(url, headers=self.headers, params=data)
+                response = self.session.get(url, headers=self.headers, params=data, timeout=REQUEST_TIMEOUT)
             elif method == "POST":
-                response = requests.post(url, headers=self.headers, json=data)
+                response = self.session.post(url, headers=self.headers, json=data, timeout=REQUEST_TIMEOUT)
             elif method == "PATCH":
-                response = requests.patch(url, headers=self.headers, json=data)
+                response = self.session.patch(url, headers=self.headers, json=data, timeout=REQUEST_TIMEOUT)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 